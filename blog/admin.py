@@ -7,19 +7,216 @@ This module defines custom admin interfaces for the blog application models:
 - PostAdmin: Allows administrators to view and edit post information, including
   overriding the `save_model` method to set `created_by` and `updated_by`
   fields.
+- CachedAutocompleteMixin: Caches the results of the autocomplete searches of
+  tags and categories.
+- PrimaryKeySearchMixin: Matches numeric search terms against the primary key
+  with an exact lookup.
+- FullTextSearchMixin: Searches the `search_vector` column of pages and posts
+  instead of scanning their content with `LIKE` on PostgreSQL.
+- DeferredFieldsChangeList and ListDeferredFieldsMixin: Skip loading the
+  large columns of pages and posts in the list view.
+- PublishActionsMixin: Adds actions to publish and unpublish the selected
+  pages and posts with a single `UPDATE`.
 
 These admin interfaces provide a user-friendly way for administrators to manage
 blog content and settings.
 """
+from hashlib import md5
 from typing import Any
 from django.contrib import admin
-from django.utils.safestring import mark_safe
+from django.contrib.admin.views.main import ChangeList
+from django.contrib.postgres.search import SearchQuery
+from django.core.cache import cache
+from django.db import connection
+from django.db.models.query import QuerySet
+from django.http import HttpRequest
+from django.utils.html import format_html
 from django_summernote.admin import SummernoteModelAdmin  # type: ignore
 from blog.models import Tag, Category, Page, Post
+from utils.cache import invalidate_model_cache, model_cache_version
+from utils.paginators import EstimatedCountPaginator
+
+_LINK_TEMPLATE = '<a target="_blank" href="{}">Ver post</a>'
+
+
+class CachedAutocompleteMixin:
+    """
+    Admin mixin that caches the primary keys matched by the autocomplete
+    searches of the model.
+
+    The autocomplete widgets of other admins query this admin on every
+    keystroke with the same few terms, so the `LIKE` search runs once per
+    term and the following requests only look up the cached primary keys.
+    The permission checks and the pagination of the autocomplete view still
+    run for every request. The cache is invalidated whenever an object of the
+    model is saved or deleted.
+
+    Attributes:
+        autocomplete_cache_timeout (int): The number of seconds the results
+        are cached for.
+    """
+    autocomplete_cache_timeout: int = 60
+
+    def get_search_results(
+            self, request: HttpRequest, queryset: QuerySet, search_term: str
+    ) -> tuple[QuerySet, bool]:
+        search_results = super().get_search_results  # type: ignore
+        match = request.resolver_match
+        if (not search_term or match is None
+                or match.url_name != 'autocomplete'):
+            return search_results(request, queryset, search_term)
+
+        def matching_pks() -> list:
+            results, may_have_duplicates = search_results(
+                request, queryset, search_term)
+            if may_have_duplicates:
+                results = results.distinct()
+            return list(results.values_list('pk', flat=True))
+
+        source = (
+            request.GET.get('app_label', ''),
+            request.GET.get('model_name', ''),
+            request.GET.get('field_name', ''),
+            search_term,
+        )
+        cache_key = 'admin-autocomplete:{}:{}:{}'.format(
+            self.model._meta.label_lower,  # type: ignore
+            model_cache_version(self.model),  # type: ignore
+            md5('\0'.join(source).encode(),
+                usedforsecurity=False).hexdigest(),
+        )
+        pks = cache.get_or_set(
+            cache_key, matching_pks, self.autocomplete_cache_timeout)
+        return queryset.filter(pk__in=pks), False
+
+
+class PrimaryKeySearchMixin:
+    """
+    Admin mixin that also matches numeric search terms against the primary
+    key.
+
+    `id` is not part of `search_fields`, where it would be compared with
+    `icontains` on the id cast to text, which can't use the primary key
+    index. Numeric terms are looked up with an exact `pk` match instead.
+
+    Attributes:
+        max_pk (int): The largest value of the primary key column.
+    """
+    max_pk: int = 2 ** 63 - 1
+
+    def get_search_results(
+            self, request: HttpRequest, queryset: QuerySet, search_term: str
+    ) -> tuple[QuerySet, bool]:
+        search_results = super().get_search_results  # type: ignore
+        results, may_have_duplicates = search_results(
+            request, queryset, search_term)
+        search_term = search_term.strip()
+        # `isdigit` also accepts digits like '²' that `int` can't parse.
+        if search_term.isdecimal() and int(search_term) <= self.max_pk:
+            results |= queryset.filter(pk=int(search_term))
+        return results, may_have_duplicates
+
+
+class FullTextSearchMixin:
+    """
+    Admin mixin that searches the model's `search_vector` column.
+
+    On PostgreSQL the search term is matched against the GIN indexed
+    `search_vector`, so the large `content` column is never scanned with
+    `LIKE`. On other databases `content` is appended to `search_fields`
+    instead.
+
+    Attributes:
+        search_config (str): The text search configuration used to parse the
+        search term.
+    """
+    search_config: str = 'portuguese'
+
+    def get_search_fields(self, request: HttpRequest) -> tuple:
+        search_fields = tuple(
+            super().get_search_fields(request))  # type: ignore
+        if connection.vendor == 'postgresql':
+            return search_fields
+        return (*search_fields, 'content')
+
+    def get_search_results(
+            self, request: HttpRequest, queryset: QuerySet, search_term: str
+    ) -> tuple[QuerySet, bool]:
+        search_results = super().get_search_results  # type: ignore
+        results, may_have_duplicates = search_results(
+            request, queryset, search_term)
+        if search_term and connection.vendor == 'postgresql':
+            results |= queryset.filter(search_vector=SearchQuery(
+                search_term, config=self.search_config,
+                search_type='websearch',
+            ))
+        return results, may_have_duplicates
+
+
+class DeferredFieldsChangeList(ChangeList):
+    """
+    Change list that defers the model admin's `list_deferred_fields`, so
+    columns that are never displayed in the list view are not loaded for
+    every row of the page.
+    """
+
+    def get_queryset(
+            self, request: HttpRequest, exclude_parameters: Any = None
+    ) -> QuerySet:
+        queryset = super().get_queryset(request, exclude_parameters)
+        return queryset.defer(
+            *self.model_admin.list_deferred_fields)  # type: ignore
+
+
+class ListDeferredFieldsMixin:
+    """
+    Admin mixin that uses `DeferredFieldsChangeList` in the list view.
+
+    Only the list view defers the fields, the change form still loads the
+    whole object with a single query.
+
+    Attributes:
+        list_deferred_fields (tuple): A tuple of field names that are not
+        loaded in the list view.
+    """
+    list_deferred_fields: tuple = ()
+
+    def get_changelist(self, request: HttpRequest, **kwargs: Any) -> type:
+        return DeferredFieldsChangeList
+
+
+class PublishActionsMixin:
+    """
+    Admin mixin that publishes or unpublishes the selected objects.
+
+    The actions run a single `UPDATE` through `queryset.update()`, so the
+    model's `save()` method, `auto_now` fields and signals are not run for
+    the updated rows. The cache of the model is invalidated by hand instead.
+
+    Methods:
+        mark_published(request, queryset)
+            Marks the selected objects as published.
+        mark_unpublished(request, queryset)
+            Marks the selected objects as not published.
+    """
+    actions: tuple = ('mark_published', 'mark_unpublished')
+
+    @admin.action(description='Mark selected as published')
+    def mark_published(
+            self, request: HttpRequest, queryset: QuerySet) -> None:
+        queryset.update(is_published=True)
+        invalidate_model_cache(queryset.model)
+
+    @admin.action(description='Mark selected as not published')
+    def mark_unpublished(
+            self, request: HttpRequest, queryset: QuerySet) -> None:
+        queryset.update(is_published=False)
+        invalidate_model_cache(queryset.model)
 
 
 @admin.register(Tag)
-class TagAdmin(admin.ModelAdmin):
+class TagAdmin(
+        CachedAutocompleteMixin, PrimaryKeySearchMixin, admin.ModelAdmin):
     """
     Custom admin interface for the Tag model.
 
@@ -41,14 +238,15 @@ class TagAdmin(admin.ModelAdmin):
     """
     list_display: tuple = ('id', 'name', 'slug')
     list_display_links: tuple = ('name',)
-    search_fields: tuple = ('id', 'name', 'slug')
+    search_fields: tuple = ('name', 'slug')
     list_per_page: int = 10
     ordering: tuple = ('-id',)
     prepopulated_fields: dict = {'slug': ('name',)}
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(
+        CachedAutocompleteMixin, PrimaryKeySearchMixin, admin.ModelAdmin):
     """
     Custom admin interface for the Category model.
 
@@ -70,14 +268,16 @@ class CategoryAdmin(admin.ModelAdmin):
     """
     list_display: tuple = ('id', 'name', 'slug')
     list_display_links: tuple = ('name',)
-    search_fields: tuple = ('id', 'name', 'slug')
+    search_fields: tuple = ('name', 'slug')
     list_per_page: int = 10
     ordering: tuple = ('-id',)
     prepopulated_fields: dict = {'slug': ('name',)}
 
 
 @admin.register(Page)
-class PageAdmin(SummernoteModelAdmin):
+class PageAdmin(
+        ListDeferredFieldsMixin, PublishActionsMixin, PrimaryKeySearchMixin,
+        FullTextSearchMixin, SummernoteModelAdmin):
     """
     Custom admin interface for the Page model.
 
@@ -94,26 +294,35 @@ class PageAdmin(SummernoteModelAdmin):
         list view.
         list_filter (tuple): A tuple of field names to use for filtering the
         list view.
-        list_editable (tuple): A tuple of field names to make editable in the
-        list view.
+        actions (tuple): The names of the actions available in the list
+        view.
         ordering (tuple): A tuple of field names to use for ordering the list
         view.
         prepopulated_fields (dict): A dictionary of field names to use for
         prepopulating fields in the form view.
+        paginator (type): The paginator class used in the list view.
+        show_full_result_count (bool): Whether to count all the objects when
+        the list view is filtered.
+        list_deferred_fields (tuple): A tuple of field names that are not
+        loaded in the list view.
     """
     summernote_fields = ('content',)
     list_display: tuple = ('id', 'title', 'is_published')
     list_display_links: tuple = ('title',)
-    search_fields: tuple = ('id', 'slug', 'title', 'content')
+    search_fields: tuple = ('slug', 'title')
     list_per_page: int = 50
     list_filter: tuple = ('is_published',)
-    list_editable: tuple = ('is_published',)
     ordering: tuple = ('-id',)
     prepopulated_fields: dict = {'slug': ('title',)}
+    paginator: type = EstimatedCountPaginator
+    show_full_result_count: bool = False
+    list_deferred_fields: tuple = ('content', 'search_vector')
 
 
 @admin.register(Post)
-class PostAdmin(SummernoteModelAdmin):
+class PostAdmin(
+        ListDeferredFieldsMixin, PublishActionsMixin, PrimaryKeySearchMixin,
+        FullTextSearchMixin, SummernoteModelAdmin):
     """
     Custom admin interface for the Post model.
 
@@ -130,8 +339,10 @@ class PostAdmin(SummernoteModelAdmin):
             list view.
         list_filter (tuple): A tuple of field names to use for filtering the
             list view.
-        list_editable (tuple): A tuple of field names to make editable in the
-            list view.
+        list_select_related (tuple): A tuple of foreign keys joined in the
+            list view query, only the author is displayed.
+        actions (tuple): The names of the actions available in the list
+            view.
         ordering (tuple): A tuple of field names to use for ordering the list
             view.
         readonly_fields (tuple): A tuple of field names to make read-only in
@@ -140,25 +351,45 @@ class PostAdmin(SummernoteModelAdmin):
             prepopulating fields in the form view.
         autocomplete_fields (tuple): A tuple of field names to use for
             autocompleting fields in the form view.
+        paginator (type): The paginator class used in the list view.
+        show_full_result_count (bool): Whether to count all the objects when
+            the list view is filtered.
+        list_deferred_fields (tuple): A tuple of field names that are not
+            loaded in the list view.
 
     Methods:
+        formfield_for_manytomany(db_field, request, **kwargs)
+            Override the default form field to load only the tag columns
+            needed to render the widget.
+        get_update_fields(obj, form)
+            Returns the columns written when an existing post is saved.
         save_model(request, obj, form, change)
             Override the default save method to set the created_by and
-            updated_by fields.
+            updated_by fields and to only update the changed columns of an
+            existing post.
     """
     summernote_fields = ('content',)
     list_display: tuple = ('id', 'title', 'is_published', 'created_by')
     list_display_links: tuple = ('title',)
-    search_fields: tuple = ('id', 'slug', 'title', 'excerpt', 'content')
+    search_fields: tuple = ('slug', 'title', 'excerpt')
     list_per_page: int = 50
     list_filter: tuple = ('category', 'is_published')
-    list_editable: tuple = ('is_published',)
+    list_select_related: tuple = ('created_by',)
     ordering: tuple = ('-id',)
     readonly_fields: tuple = (
         'created_at', 'updated_at', 'created_by', 'updated_by', 'link'
     )
     prepopulated_fields: dict = {'slug': ('title',)}
     autocomplete_fields: tuple = ('category', 'tags')
+    paginator: type = EstimatedCountPaginator
+    show_full_result_count: bool = False
+    list_deferred_fields: tuple = ('excerpt', 'content', 'search_vector')
+
+    def formfield_for_manytomany(
+            self, db_field: Any, request: HttpRequest, **kwargs: Any) -> Any:
+        if db_field.name == 'tags':
+            kwargs['queryset'] = Tag.objects.only('id', 'name')
+        return super().formfield_for_manytomany(db_field, request, **kwargs)
 
     def link(self, obj):
         """
@@ -170,17 +401,31 @@ class PostAdmin(SummernoteModelAdmin):
         if not obj.pk:
             return '-'
 
-        url_of_post = obj.get_absolute_url()
-        safe_link = mark_safe(
-            f'<a target="_blank" href="{url_of_post}">Ver post</a>'
-        )
+        return format_html(_LINK_TEMPLATE, obj.get_absolute_url())
 
-        return safe_link
+    def get_update_fields(self, obj: Post, form: Any) -> list | None:
+        """
+        Returns the columns to write when an existing post is saved through
+        the change form: the concrete fields changed in the form, the
+        `updated_by` and `updated_at` fields and the `slug` when `save()` is
+        going to generate it.
+        """
+        if form is None:
+            return None
+        concrete_fields = {
+            field.name for field in obj._meta.concrete_fields}
+        update_fields = {
+            name for name in form.changed_data if name in concrete_fields}
+        update_fields.update(('updated_by', 'updated_at'))
+        if not obj.slug:
+            update_fields.add('slug')
+        return sorted(update_fields)
 
     def save_model(
             self, request: Any, obj: Any, form: Any, change: Any) -> None:
         if change:
             obj.updated_by = request.user
+            obj.save(update_fields=self.get_update_fields(obj, form))
         else:
             obj.created_by = request.user
-        obj.save()
+            obj.save()
@@ -0,0 +1,86 @@
+# Generated by Django 5.0.6 on 2026-10-15 08:18
+
+import django.contrib.postgres.search
+from django.db import migrations
+
+# (table, (source column, weight)) whose `search_vector` is maintained by a
+# trigger. The weights let `SearchRank` rank a match in the title above one
+# in the excerpt, and both above one in the content.
+SEARCH_VECTOR_TABLES = (
+    ('blog_page', (('title', 'A'), ('content', 'C'))),
+    ('blog_post', (('title', 'A'), ('excerpt', 'B'), ('content', 'C'))),
+)
+
+
+def weighted_document(columns, prefix=''):
+    # `tsvector_update_trigger` can't weight the columns, so the document is
+    # built with `setweight` both by the trigger function and the backfill.
+    return ' || '.join(
+        f"setweight(to_tsvector('pg_catalog.portuguese', "
+        f"coalesce({prefix}{column}, '')), '{weight}')"
+        for column, weight in columns
+    )
+
+
+def create_search_vector_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for table, columns in SEARCH_VECTOR_TABLES:
+        schema_editor.execute(
+            f'CREATE FUNCTION {table}_search_vector_update() '
+            f'RETURNS trigger LANGUAGE plpgsql AS $$ BEGIN '
+            f'NEW.search_vector := {weighted_document(columns, "NEW.")}; '
+            f'RETURN NEW; END $$'
+        )
+        schema_editor.execute(
+            f'CREATE TRIGGER {table}_search_vector_update '
+            f'BEFORE INSERT OR UPDATE ON {table} FOR EACH ROW '
+            f'EXECUTE FUNCTION {table}_search_vector_update()'
+        )
+        schema_editor.execute(
+            f'UPDATE {table} SET search_vector = {weighted_document(columns)}'
+        )
+        schema_editor.execute(
+            f'CREATE INDEX {table}_search_vector_gin '
+            f'ON {table} USING gin (search_vector)'
+        )
+
+
+def drop_search_vector_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for table, _ in SEARCH_VECTOR_TABLES:
+        schema_editor.execute(
+            f'DROP TRIGGER IF EXISTS {table}_search_vector_update ON {table}'
+        )
+        schema_editor.execute(
+            f'DROP FUNCTION IF EXISTS {table}_search_vector_update()'
+        )
+        schema_editor.execute(
+            f'DROP INDEX IF EXISTS {table}_search_vector_gin'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_postattachment'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='post',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunPython(
+            create_search_vector_triggers, drop_search_vector_triggers,
+        ),
+    ]
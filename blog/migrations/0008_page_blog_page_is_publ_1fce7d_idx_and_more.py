@@ -0,0 +1,27 @@
+# Generated by Django 5.0.6 on 2026-10-15 08:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0007_page_search_vector_post_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='page',
+            index=models.Index(fields=['is_published', '-id'], name='blog_page_is_publ_1fce7d_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_published', '-id'], name='blog_post_is_publ_d288b8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['category', 'is_published', '-id'], name='blog_post_categor_9acbaf_idx'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.0.6 on 2026-10-15 08:31
+
+from django.db import migrations
+
+# (table, columns) searched with `icontains` by the admin.
+TRIGRAM_INDEXED_COLUMNS = (
+    ('blog_tag', ('name', 'slug')),
+    ('blog_category', ('name', 'slug')),
+)
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        )
+        if cursor.fetchone() is None:
+            return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # `icontains` compiles to `UPPER(column::text) LIKE UPPER(%s)` on
+    # PostgreSQL, so the index has to be built on the same expression.
+    for table, columns in TRIGRAM_INDEXED_COLUMNS:
+        for column in columns:
+            schema_editor.execute(
+                f'CREATE INDEX IF NOT EXISTS {table}_{column}_trgm '
+                f'ON {table} USING gin (UPPER({column}::text) gin_trgm_ops)'
+            )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for table, columns in TRIGRAM_INDEXED_COLUMNS:
+        for column in columns:
+            schema_editor.execute(
+                f'DROP INDEX IF EXISTS {table}_{column}_trgm'
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0008_page_blog_page_is_publ_1fce7d_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.6 on 2026-10-15 08:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0009_tag_category_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='post',
+            name='tags',
+            field=models.ManyToManyField(blank=True, to='blog.tag'),
+        ),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 5.0.6 on 2026-10-15 08:45
+
+from django.db import migrations
+
+# Columns of `blog_post` searched with `icontains` by `SearchListView`.
+TRIGRAM_INDEXED_COLUMNS = ('title', 'excerpt', 'content')
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+        )
+        if cursor.fetchone() is None:
+            return
+
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # `icontains` compiles to `UPPER(column::text) LIKE UPPER(%s)` on
+    # PostgreSQL, so the index has to be built on the same expression.
+    for column in TRIGRAM_INDEXED_COLUMNS:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS blog_post_{column}_trgm '
+            f'ON blog_post USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for column in TRIGRAM_INDEXED_COLUMNS:
+        schema_editor.execute(f'DROP INDEX IF EXISTS blog_post_{column}_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0011_remove_post_tags_default'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-15 08:49
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0012_post_trigram_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['created_by', 'is_published', '-id'], name='blog_post_created_b103f5_idx'),
+        ),
+    ]
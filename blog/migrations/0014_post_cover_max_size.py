@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-15 09:12
+
+import utils.model_validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0013_post_created_by_is_published_id_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='post',
+            name='cover',
+            field=models.ImageField(blank=True, default='', upload_to='posts/%Y/%m', validators=[utils.model_validators.validate_file_size]),
+        ),
+    ]
@@ -4,6 +4,8 @@ which represent a tag, a category, a page and a post in the application,
 respectively.
 
 Classes:
+    SlugManager
+        A manager that creates objects in bulk with generated slugs.
     Tag
         A model representing a tag in the application.
     Category
@@ -17,13 +19,41 @@ Methods:
     save(*args, **kwargs)
         Override the default save method to generate a unique slug for the
         tag, category, page or post if it does not already have one.
+
+Functions:
+    cached_reverse(viewname, args=())
+        Reverse a URL once per process, used by `get_absolute_url`.
 """
+from functools import lru_cache
+from django.conf import settings
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
-from django.urls import reverse
+from django.urls import get_script_prefix, get_urlconf, reverse
 from django.contrib.auth.models import User
 from django_summernote.models import AbstractAttachment  # type: ignore
-from utils.rands import slugify_new
-from utils.images import resize_image
+from utils.rands import bulk_unique_slugs, slugify_new
+from utils.cache import invalidate_model_cache
+from utils.images import resize_uploaded_image
+from utils.model_validators import validate_file_size
+
+
+@lru_cache(maxsize=4096)
+def _cached_reverse(viewname, args, script_prefix, urlconf):
+    return reverse(viewname, args=args, urlconf=urlconf)
+
+
+def cached_reverse(viewname, args=()):
+    """
+    Reverse `viewname` once per process for each `args`.
+
+    The script prefix and the URLconf in use are part of the cache key, so a
+    different deployment path or URLconf never gets a stale URL. A changed
+    slug is a new key, so the cache never needs to be cleared.
+    """
+    return _cached_reverse(
+        viewname, tuple(args), get_script_prefix(),
+        get_urlconf() or settings.ROOT_URLCONF,
+    )
 
 
 class PostAttachment(AbstractAttachment):
@@ -45,18 +75,51 @@ class PostAttachment(AbstractAttachment):
         if not self.name:
             self.name = self.file.name
 
-        current_file_name = str(self.file.name)
-        # pylint: disable=assignment-from-no-return
-        super_save = super().save(*args, **kwargs)
-        file_changed = False
+        update_fields = kwargs.get('update_fields')
+        # pylint: disable=protected-access
+        if (self.file and not self.file._committed
+                and (update_fields is None or 'file' in update_fields)):
+            resize_uploaded_image(self.file, 900, True, 70)
 
-        if self.file:
-            file_changed = current_file_name != self.file.name
+        return super().save(*args, **kwargs)
 
-        if file_changed:
-            resize_image(self.file, 900, True, 70)
 
-        return super_save
+class SlugManager(models.Manager):
+    """
+    Custom manager for models with a slug generated by `slugify_new`.
+
+    Attributes:
+        slug_source (str): The name of the field the slug is generated from.
+    """
+
+    def __init__(self, slug_source='name'):
+        super().__init__()
+        self.slug_source = slug_source
+
+    def bulk_create_with_slugs(self, objs, batch_size=500):
+        """
+        Generates the missing slugs of `objs` and creates them with
+        `bulk_create`.
+
+        The slugs are generated by `bulk_unique_slugs`, so a whole import
+        costs one `SELECT` and the batched `INSERT`s instead of a `save()` per
+        object. As with `bulk_create`, `save()` and the signals
+        are not run for the objects, so the cache of the model is invalidated
+        by hand instead.
+        """
+        objs = list(objs)
+        pending = [obj for obj in objs if not obj.slug]
+        slugs = bulk_unique_slugs(
+            self.model,
+            [getattr(obj, self.slug_source) for obj in pending],
+            reserved={obj.slug for obj in objs if obj.slug},
+        )
+        for obj, slug in zip(pending, slugs):
+            obj.slug = slug
+
+        created = self.bulk_create(objs, batch_size=batch_size)
+        invalidate_model_cache(self.model)
+        return created
 
 
 class Tag(models.Model):
@@ -95,10 +158,10 @@ class Tag(models.Model):
             self.slug = slugify_new(self.name, 4)
         return super().save(*args, **kwargs)
 
-    objects = models.Manager()
+    objects = SlugManager()
 
     def __str__(self) -> str:
-        return str(self.name)
+        return self.name or ''
 
 
 class Category(models.Model):
@@ -137,10 +200,10 @@ class Category(models.Model):
             self.slug = slugify_new(self.name, 4)
         return super().save(*args, **kwargs)
 
-    objects = models.Manager()
+    objects = SlugManager()
 
     def __str__(self) -> str:
-        return str(self.name)
+        return self.name or ''
 
 
 class Page(models.Model):
@@ -152,6 +215,8 @@ class Page(models.Model):
         slug (str): A unique slug for the page.
         is_published (bool): Whether the page is published or not.
         content (str): The content of the page.
+        search_vector (SearchVectorField): The full-text search document of
+            the page, kept up to date by a database trigger on PostgreSQL.
     """
     class Meta:
         """
@@ -159,6 +224,9 @@ class Page(models.Model):
         """
         verbose_name = 'Page'
         verbose_name_plural = 'Pages'
+        indexes = [
+            models.Index(fields=['is_published', '-id']),
+        ]
 
     title: str = models.CharField(max_length=65)  # type: ignore
     slug: str = models.SlugField(
@@ -172,6 +240,7 @@ class Page(models.Model):
         ),
     )  # type: ignore
     content = models.TextField()  # type: ignore
+    search_vector = SearchVectorField(null=True, editable=False)
 
     def get_absolute_url(self):
         """
@@ -181,9 +250,9 @@ class Page(models.Model):
         can be used for linking in templates or other contexts.
         """
         if not self.is_published:
-            return reverse('blog:index')
+            return cached_reverse('blog:index')
 
-        return reverse('blog:page', args=(self.slug,))
+        return cached_reverse('blog:page', args=(self.slug,))
 
     def save(self, *args, **kwargs):
         """
@@ -200,13 +269,13 @@ class Page(models.Model):
             self.slug = slugify_new(self.title, 4)
         return super().save(*args, **kwargs)
 
-    objects = models.Manager()
+    objects = SlugManager('title')
 
     def __str__(self) -> str:
-        return str(self.title)
+        return self.title or ''
 
 
-class PostManager(models.Manager):
+class PostManager(SlugManager):
     """
     Custom manager for the Post model.
     """
@@ -217,6 +286,34 @@ class PostManager(models.Manager):
         """
         return self.filter(is_published=True).order_by('-pk')
 
+    def get_published_list(self):
+        """
+        Returns the published posts loading only the columns used by the post
+        cards of the listings, so the `content` of every post is not read.
+        """
+        return self.get_published().only(
+            'id', 'title', 'slug', 'excerpt', 'cover', 'is_published',
+            'category',
+        )
+
+    def bulk_apply_tag(self, post_ids, tag_id, batch_size=1000):
+        """
+        Adds the tag `tag_id` to all the posts of `post_ids`.
+
+        The rows of the through table are inserted with a single
+        `bulk_create` that ignores the posts already tagged, instead of a
+        check and an `INSERT` per post. The `m2m_changed` signal is not sent,
+        so the cache of the posts is invalidated by hand instead.
+        """
+        through = self.model.tags.through
+        created = through.objects.bulk_create(
+            [through(post_id=post_id, tag_id=tag_id) for post_id in post_ids],
+            ignore_conflicts=True,
+            batch_size=batch_size,
+        )
+        invalidate_model_cache(self.model)
+        return created
+
 
 class Post(models.Model):
     """
@@ -237,6 +334,8 @@ class Post(models.Model):
         updated_by (ForeignKey): The user who updated the post.
         category (ForeignKey): The category the post belongs to.
         tags (ManyToManyField): The tags associated with the post.
+        search_vector (SearchVectorField): The full-text search document of
+            the post, kept up to date by a database trigger on PostgreSQL.
     """
     class Meta:
         """
@@ -244,8 +343,13 @@ class Post(models.Model):
         """
         verbose_name = 'Post'
         verbose_name_plural = 'Posts'
+        indexes = [
+            models.Index(fields=['is_published', '-id']),
+            models.Index(fields=['category', 'is_published', '-id']),
+            models.Index(fields=['created_by', 'is_published', '-id']),
+        ]
 
-    objects = PostManager()
+    objects = PostManager('title')
 
     title: str = models.CharField(max_length=65)  # type: ignore
     slug: str = models.SlugField(
@@ -261,7 +365,8 @@ class Post(models.Model):
     )  # type: ignore
     content = models.TextField()  # type: ignore
     cover = models.ImageField(upload_to='posts/%Y/%m',
-                              blank=True, default='')
+                              blank=True, default='',
+                              validators=[validate_file_size])
     cover_in_post_content: bool = models.BooleanField(
         default=True,
         help_text=('Se marcado, exibirá a capa dentro do post.'),
@@ -282,7 +387,8 @@ class Post(models.Model):
         Category, on_delete=models.SET_NULL, null=True, blank=True,
         default=None,
     )  # type: ignore
-    tags = models.ManyToManyField(Tag, blank=True, default='')  # type: ignore
+    tags = models.ManyToManyField(Tag, blank=True)  # type: ignore
+    search_vector = SearchVectorField(null=True, editable=False)
 
     def get_absolute_url(self):
         """
@@ -292,12 +398,12 @@ class Post(models.Model):
         which can be used for linking in templates or other contexts.
         """
         if not self.is_published:
-            return reverse('blog:index')
+            return cached_reverse('blog:index')
 
-        return reverse('blog:post', args=(self.slug,))
+        return cached_reverse('blog:post', args=(self.slug,))
 
     def __str__(self) -> str:
-        return str(self.title)
+        return self.title or ''
 
     def save(self, *args, **kwargs):
         """
@@ -313,15 +419,10 @@ class Post(models.Model):
         if not self.slug:
             self.slug = slugify_new(self.title, 4)
 
-        current_cover_name = str(self.cover.name)
-        # pylint: disable=assignment-from-none
-        super_save = super().save(*args, **kwargs)
-        cover_changed = False
+        update_fields = kwargs.get('update_fields')
+        # pylint: disable=protected-access
+        if (self.cover and not self.cover._committed
+                and (update_fields is None or 'cover' in update_fields)):
+            resize_uploaded_image(self.cover, 900, True, 70)
 
-        if self.cover:
-            cover_changed = current_cover_name != self.cover.name
-
-        if cover_changed:
-            resize_image(self.cover, 900, True, 70)
-
-        return super_save
+        return super().save(*args, **kwargs)
@@ -0,0 +1,48 @@
+"""
+Signal receivers of the blog application.
+
+Functions:
+    invalidate_autocomplete_cache(sender, **kwargs)
+        Invalidate the cached admin autocomplete results of tags and
+        categories when one of them is saved or deleted.
+    invalidate_post_list_cache(sender, **kwargs)
+        Invalidate the cached post listings when a post is saved, deleted or
+        has its tags changed.
+    invalidate_user_cache(sender, **kwargs)
+        Invalidate the cached authors of the post listings when a user is
+        saved or deleted.
+"""
+from django.contrib.auth.models import User
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from blog.models import Category, Post, Tag
+from utils.cache import invalidate_model_cache
+
+
+@receiver([post_save, post_delete], sender=Tag)
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_autocomplete_cache(sender, **kwargs):
+    """
+    Invalidate the cached admin autocomplete results of the saved or deleted
+    tag or category.
+    """
+    invalidate_model_cache(sender)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+@receiver([post_save, post_delete], sender=Post)
+def invalidate_post_list_cache(sender, **kwargs):
+    """
+    Invalidate the cached post listings, which are keyed by the cache version
+    of `Post`.
+    """
+    invalidate_model_cache(Post)
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user_cache(sender, **kwargs):
+    """
+    Invalidate the cached authors of the post listings, which are keyed by the
+    cache version of `User`.
+    """
+    invalidate_model_cache(User)
@@ -2,41 +2,57 @@
 Module containing test cases for the PostAdmin class used in the blog
 application.
 """
+from types import SimpleNamespace
 from django.contrib.auth.models import User
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
-from blog.models import Post, Category
+from blog.models import Post, Category, Tag
 from blog.admin import PostAdmin
+from .test_blog_base import FAST_PASSWORD_HASHERS
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class BlogPostAdminTest(TestCase):
     """
     Test suite for the PostAdmin class used in the blog application.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
         Creates a superuser, a category, and a post to be used in the tests.
+
+        The objects and the admin URLs are created once for the whole class,
+        each test gets its own copy of them.
         """
-        self.user = User.objects.create_superuser(
+        cls.user = User.objects.create_superuser(
             username='admin',
             password='admin',
             email='admin@example.com',
         )
-        self.client.force_login(self.user)
-
-        self.category = Category.objects.create(
+        cls.category = Category.objects.create(
             name='Test Category', slug='test-category')
-        # self.tag = Tag.objects.create(name='Test Tag', slug='test-tag')
-        self.post = Post.objects.create(
+        # cls.tag = Tag.objects.create(name='Test Tag', slug='test-tag')
+        cls.post = Post.objects.create(
             title='Test Post',
             slug='test-post',
-            category=self.category,
-            # tags=[self.tag],
+            category=cls.category,
+            # tags=[cls.tag],
             content='Test post content',
             is_published=True,
-            created_by=self.user,
+            created_by=cls.user,
         )
+        cls.changelist_url = reverse('admin:blog_post_changelist')
+        cls.change_url = reverse('admin:blog_post_change', args=[cls.post.pk])
+
+    def setUp(self) -> None:
+        """
+        Logs the superuser in, the test client is created for every test.
+        """
+        self.client.force_login(self.user)
 
     def test_post_admin_list_display(self):
         """
@@ -46,12 +62,96 @@ class BlogPostAdminTest(TestCase):
         This test verifies that the title, published status, and author of the
         post are displayed in the list of posts.
         """
-        admin_url = reverse('admin:blog_post_changelist')
+        admin_url = self.changelist_url
         response = self.client.get(admin_url)
         self.assertContains(response, 'Test Post')
         self.assertContains(response, 'True')
         self.assertContains(response, 'admin')
 
+    def test_post_admin_list_query_count_does_not_grow_with_rows(self):
+        """
+        Tests if the post list view of the admin interface fetches the related
+        users in the same query as the posts, so the number of queries does
+        not depend on the number of rows displayed.
+        """
+        admin_url = self.changelist_url
+        with CaptureQueriesContext(connection) as single_row:
+            self.client.get(admin_url)
+
+        for i in range(5):
+            author = User.objects.create_user(username=f'author{i}')
+            Post.objects.create(
+                title=f'Post {i}', slug=f'post-{i}', content='content',
+                category=self.category, created_by=author,
+            )
+
+        with CaptureQueriesContext(connection) as many_rows:
+            self.client.get(admin_url)
+
+        self.assertEqual(len(many_rows), len(single_row))
+
+    def test_post_admin_list_does_not_load_post_content(self):
+        """
+        Tests if the post list view of the admin interface does not select the
+        `content` column, which is never displayed in the list.
+        """
+        admin_url = self.changelist_url
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(admin_url)
+
+        self.assertContains(response, 'Test Post')
+        post_selects = [
+            q['sql'] for q in queries
+            if q['sql'].startswith('SELECT')
+            and '"blog_post"."title"' in q['sql']
+        ]
+        self.assertTrue(post_selects)
+        for sql in post_selects:
+            self.assertNotIn('"blog_post"."content"', sql)
+
+    def test_post_admin_change_form_query_count_does_not_grow_with_tags(self):
+        """
+        Tests if the change form of the admin interface loads the tags of the
+        post in a batch, so the number of queries does not depend on the
+        number of tags selected.
+        """
+        admin_url = self.change_url
+        self.post.tags.add(Tag.objects.create(name='Tag 0', slug='tag-0'))
+        self.client.get(admin_url)  # warm up per-process caches
+        with CaptureQueriesContext(connection) as single_tag:
+            self.client.get(admin_url)
+
+        for i in range(1, 5):
+            self.post.tags.add(
+                Tag.objects.create(name=f'Tag {i}', slug=f'tag-{i}'))
+
+        with CaptureQueriesContext(connection) as many_tags:
+            response = self.client.get(admin_url)
+
+        self.assertContains(response, 'Tag 4')
+        self.assertEqual(len(many_tags), len(single_tag))
+
+    def test_post_admin_tag_autocomplete_is_cached_until_tags_change(self):
+        """
+        Tests if the tag autocomplete used by the post form only searches the
+        tags once per term, until a tag is saved.
+        """
+        cache.clear()
+        Tag.objects.create(name='Python', slug='python')
+        autocomplete_url = reverse('admin:autocomplete') + (
+            '?term=pyt&app_label=blog&model_name=post&field_name=tags')
+        self.client.get(autocomplete_url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(autocomplete_url)
+        self.assertContains(response, 'Python')
+        self.assertFalse(
+            [q for q in queries if 'LIKE' in q['sql'].upper()])
+
+        Tag.objects.create(name='Pytest', slug='pytest')
+        response = self.client.get(autocomplete_url)
+        self.assertContains(response, 'Pytest')
+
     def test_post_admin_search_fields(self):
         """
         Tests if the search functionality works properly in the post list view
@@ -60,11 +160,46 @@ class BlogPostAdminTest(TestCase):
         This test verifies that searching by keywords in the title or content
         of the post returns the relevant results.
         """
-        admin_url = reverse('admin:blog_post_changelist')
+        admin_url = self.changelist_url
         response = self.client.get(f'{admin_url}?q=Test')
         self.assertContains(response, 'Test Post')
         self.assertNotContains(response, 'Not Found')
 
+    def test_post_admin_search_finds_post_by_content(self):
+        """
+        Tests if searching in the post list view of the admin interface also
+        matches words of the post content.
+        """
+        Post.objects.create(
+            title='Another Post', slug='another-post',
+            content='Texto sobre programação funcional', is_published=True,
+        )
+        admin_url = self.changelist_url
+        response = self.client.get(f'{admin_url}?q=programação')
+        self.assertContains(response, 'Another Post')
+        self.assertNotContains(response, 'Test Post')
+
+    def test_post_admin_search_finds_post_by_id(self):
+        """
+        Tests if searching a number in the post list view of the admin
+        interface finds the post with that id.
+        """
+        other_post = Post.objects.create(title='Other Post', slug='other')
+        admin_url = self.changelist_url
+        response = self.client.get(f'{admin_url}?q={other_post.pk}')
+        self.assertContains(response, 'Other Post')
+        self.assertNotContains(response, 'Test Post')
+
+    def test_post_admin_search_ignores_non_decimal_digits(self):
+        """
+        Tests if searching a digit that `int` can't parse, like '²', in the
+        post list view of the admin interface returns no posts instead of an
+        error.
+        """
+        response = self.client.get(self.changelist_url, {'q': '²'})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotContains(response, 'Test Post')
+
     def test_post_admin_list_filter(self):
         """
         Tests if the filter functionality works properly in the post list view
@@ -73,11 +208,31 @@ class BlogPostAdminTest(TestCase):
         This test verifies that filtering by the published status of the post
         returns the relevant results (published or unpublished posts).
         """
-        admin_url = reverse('admin:blog_post_changelist')
+        admin_url = self.changelist_url
         response = self.client.get(f'{admin_url}?is_published=True')
         self.assertContains(response, 'Test Post')
         self.assertNotContains(response, 'Not published')
 
+    def test_post_admin_mark_unpublished_action(self):
+        """
+        Tests if the `mark_unpublished` action of the post list view updates
+        all the selected posts with a single query.
+        """
+        other_post = Post.objects.create(
+            title='Other Post', slug='other-post', is_published=True)
+        admin_url = self.changelist_url
+        data = {
+            'action': 'mark_unpublished',
+            '_selected_action': [self.post.pk, other_post.pk],
+        }
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.post(admin_url, data)
+
+        updates = [q for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertFalse(Post.objects.filter(is_published=True).exists())
+
     def test_post_admin_save_model(self):
         """
         Tests if the `save_model` method of the PostAdmin class correctly
@@ -86,7 +241,7 @@ class BlogPostAdminTest(TestCase):
         This test simulates editing a post and verifies that the `updated_by`
         field is updated with the current logged-in user.
         """
-        admin_url = reverse('admin:blog_post_change', args=[self.post.pk])
+        admin_url = self.change_url
         response = self.client.get(admin_url)
 
         # Find the ID of the content field is not needed, use the field name
@@ -104,13 +259,31 @@ class BlogPostAdminTest(TestCase):
         # Update the post object (not strictly necessary in the test)
         self.post.content = 'Updated content'
         self.post.updated_by = self.user
-        self.post.save()
+        self.post.save(update_fields=['content', 'updated_by', 'updated_at'])
 
         # Check if the post was updated and the updated_by field was updated
         # to the current user.
-        updated_post = Post.objects.get(pk=self.post.pk)
-        self.assertEqual(updated_post.content, 'Updated content')
-        self.assertEqual(updated_post.updated_by, self.user)
+        self.post.refresh_from_db(fields=['content', 'updated_by'])
+        self.assertEqual(self.post.content, 'Updated content')
+        self.assertEqual(self.post.updated_by_id, self.user.pk)
+
+    def test_post_admin_save_model_only_updates_changed_fields(self):
+        """
+        Tests if the `save_model` method of the PostAdmin class only writes
+        the fields changed in the form when editing a post.
+        """
+        request = self.client.request()
+        request.user = self.user
+        form = SimpleNamespace(changed_data=['content', 'tags'])
+
+        self.post.content = 'Changed content'
+        self.post.title = 'Title not in the form'
+        PostAdmin(Post, None).save_model(request, self.post, form, True)
+
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.content, 'Changed content')
+        self.assertEqual(self.post.title, 'Test Post')
+        self.assertEqual(self.post.updated_by_id, self.user.pk)
 
     def test_post_admin_link_no_pk(self):
         """
@@ -6,12 +6,45 @@ The `BlogTestBase` class offers helper methods to create test instances of
 various models used in the blog application, simplifying the process of setting
 up test data.
 """
-from django.test import TestCase
+from functools import lru_cache
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from blog.models import Page, Post, Category, Tag, User
 
+# The default PBKDF2 hasher is deliberately slow, the tests only need a
+# password to be stored.
+FAST_PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
+@lru_cache(maxsize=None)
+def _hashed_password(password, hasher):  # pylint: disable=unused-argument
+    return make_password(password)
+
+
+def hashed_password(password):
+    """
+    Hashes `password` once per password hasher and returns the same encoded
+    value on every call, so the authors created by the tests do not hash the
+    same password again.
+
+    The cache is keyed by the hasher in use, so a hash made by the fast
+    hasher of `BlogTestBase` is not reused by tests running with the default
+    hashers, which could not check it.
+
+    Args:
+        password (str): The raw password.
+
+    Returns:
+        str: The encoded password.
+    """
+    return _hashed_password(password, settings.PASSWORD_HASHERS[0])
+
 
 class BlogMixin:
-    def creating_category(self, name='Test Category', slug='test_category'):
+    @classmethod
+    def creating_category(cls, name='Test Category', slug='test_category'):
         """
         Creates a Category instance.
 
@@ -24,7 +57,8 @@ class BlogMixin:
         """
         return Category.objects.create(name=name, slug=slug)
 
-    def creating_tag(self, name='Test Tag', slug='test_tag'):
+    @classmethod
+    def creating_tag(cls, name='Test Tag', slug='test_tag'):
         """
         Creates a Tag instance.
 
@@ -37,8 +71,9 @@ class BlogMixin:
         """
         return Tag.objects.create(name=name, slug=slug)
 
+    @classmethod
     def creating_author(
-            self,
+            cls,
             first_name='user',
             last_name='name',
             username='username',
@@ -58,16 +93,42 @@ class BlogMixin:
         Returns:
             User: The created User instance.
         """
-        return User.objects.create_user(
+        return User.objects.create(
             first_name=first_name,
             last_name=last_name,
             username=username,
-            password=password,
-            email=email,
+            password=hashed_password(password),
+            email=User.objects.normalize_email(email),
         )
 
+    @classmethod
+    def default_category(cls):
+        """
+        Returns the category shared by the posts created without
+        `category_data`, creating it on the first call of a test.
+
+        Returns:
+            Category: The default Category instance.
+        """
+        return Category.objects.get_or_create(
+            slug='test_category', defaults={'name': 'Test Category'},
+        )[0]
+
+    @classmethod
+    def default_author(cls):
+        """
+        Returns the author shared by the posts created without
+        `created_by_data`, creating it on the first call of a test.
+
+        Returns:
+            User: The default User instance.
+        """
+        return User.objects.filter(username='username').first() or \
+            cls.creating_author()
+
+    @classmethod
     def creating_post(
-            self,
+            cls,
             category_data=None,
             title='Post Title',
             slug='post_title',
@@ -76,13 +137,16 @@ class BlogMixin:
             created_by_data=None,
             content='Criando um post para pytest.',
             cover_in_post_content=True,
+            category=None,
+            author=None,
     ):
         """
         Creates a Post instance.
 
         Args:
             category_data (dict, optional): Data for creating the category of
-                                            the post. Defaults to None.
+                                            the post. Defaults to None, which
+                                            reuses `default_category()`.
             title (str, optional): The title of the post. Defaults to 'Post
                                    Title'.
             slug (str, optional): The slug of the post. Defaults to
@@ -92,34 +156,44 @@ class BlogMixin:
             is_published (bool, optional): Whether the post is published.
             Defaults to True.
             created_by_data (dict, optional): Data for creating the author of
-                                              the post. Defaults to None.
+                                              the post. Defaults to None,
+                                              which reuses `default_author()`.
             content (str, optional): The content of the post. Defaults to
                                      'Criando um post para pytest.'.
             cover_in_post_content (bool, optional): Whether the post has a
                                                 cover image. Defaults to True.
+            category (Category, optional): An existing category to reuse
+                                           instead of creating one from
+                                           `category_data`. Defaults to None.
+            author (User, optional): An existing author to reuse instead of
+                                     creating one from `created_by_data`.
+                                     Defaults to None.
 
         Returns:
             Post: The created Post instance.
         """
-        if category_data is None:
-            category_data = {}
+        if category is None:
+            category = (cls.creating_category(**category_data)
+                        if category_data else cls.default_category())
 
-        if created_by_data is None:
-            created_by_data = {}
+        if author is None:
+            author = (cls.creating_author(**created_by_data)
+                      if created_by_data else cls.default_author())
 
         return Post.objects.create(
-            category=self.creating_category(**category_data),
+            category=category,
             title=title,
             slug=slug,
             excerpt=excerpt,
             is_published=is_published,
-            created_by=self.creating_author(**created_by_data),
+            created_by=author,
             content=content,
             cover_in_post_content=cover_in_post_content,
         )
 
+    @classmethod
     def creating_page(
-            self,
+            cls,
             title='Page title',
             slug='page_title',
             is_published=True,
@@ -148,17 +222,52 @@ class BlogMixin:
             content=content,
         )
 
-    def creating_posts_in_batch(self, qtd=10):
-        posts = []
-        for i in range(qtd):
-            kwargs = {'slug': f'r{i}'}
-            kwargs_category = {'name': f'Cat{i}', 'slug': f'cat{i}'}
-            post = self.creating_post(
-                category_data=kwargs_category, slug=kwargs)
-            posts.append(post)
-        return posts
+    @classmethod
+    def creating_posts_in_batch(cls, qtd=10, batch_size=500):
+        """
+        Creates `qtd` published Post instances, each one with its own
+        category and author.
+
+        The categories, authors and posts are inserted with `bulk_create` and
+        the slugs of the posts are generated with a single query, so the
+        number of queries does not grow with `qtd`. The authors share one
+        hashed password.
+
+        Args:
+            qtd (int, optional): The number of posts. Defaults to 10.
+            batch_size (int, optional): The maximum number of rows inserted
+                                        per query. Defaults to 500.
+
+        Returns:
+            list[Post]: The created Post instances.
+        """
+        categories = Category.objects.bulk_create(
+            [Category(name=f'Cat{i}', slug=f'cat{i}') for i in range(qtd)],
+            batch_size=batch_size,
+        )
+        password = hashed_password('123456')
+        authors = User.objects.bulk_create(
+            [User(username=f'username{i}', password=password)
+             for i in range(qtd)],
+            batch_size=batch_size,
+        )
+        return Post.objects.bulk_create_with_slugs(
+            [
+                Post(
+                    category=categories[i],
+                    title=f'Post Title {i}',
+                    excerpt='Post excerpt',
+                    is_published=True,
+                    created_by=authors[i],
+                    content='Criando um post para pytest.',
+                )
+                for i in range(qtd)
+            ],
+            batch_size=batch_size,
+        )
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class BlogTestBase(TestCase, BlogMixin):
     """
     Base class for blog application tests, providing helper methods for
@@ -167,6 +276,8 @@ class BlogTestBase(TestCase, BlogMixin):
 
     def setUp(self) -> None:
         """
-        Sets up the test environment.
+        Sets up the test environment, clearing the cache so the listings
+        cached by a previous test, whose rows were rolled back, are not used.
         """
+        cache.clear()
         return super().setUp()
@@ -0,0 +1,26 @@
+"""
+Tests the helpers shared by the blog tests.
+"""
+from django.contrib.auth.hashers import check_password, identify_hasher
+from django.test import SimpleTestCase, override_settings
+from .test_blog_base import FAST_PASSWORD_HASHERS, hashed_password
+
+
+class BlogTestHelpersTest(SimpleTestCase):
+    """
+    Tests the `hashed_password` helper.
+    """
+
+    def test_hashed_password_is_cached_per_password_hasher(self):
+        """
+        Tests if a password hashed under the fast hasher is hashed again, and
+        can be checked, when the default hashers are in use.
+        """
+        with override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS):
+            fast_hash = hashed_password('cached-password')
+            self.assertEqual(identify_hasher(fast_hash).algorithm, 'md5')
+
+        default_hash = hashed_password('cached-password')
+
+        self.assertNotEqual(identify_hasher(default_hash).algorithm, 'md5')
+        self.assertTrue(check_password('cached-password', default_hash))
@@ -2,6 +2,7 @@
 Tests for the Category model in the blog application.
 """
 from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
 from parameterized import parameterized  # type: ignore
 from .test_blog_base import BlogTestBase, Category
 
@@ -11,28 +12,15 @@ class BlogCategoryModelTest(BlogTestBase):
     Tests for the Category model.
     """
 
-    def setUp(self) -> None:
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
-        Sets up a Category instance for testing.
+        Sets up a Category instance for testing, created once for the class.
         """
-        self.category = self.creating_category(
+        cls.category = cls.creating_category(
             name='Category Testing',
             slug='category_testing',
         )
-        return super().setUp()
-
-    @parameterized.expand([
-        ('name', 255),
-        ('slug', 255),
-    ])
-    def test_category_fields_max_length(self, field, max_length):
-        """
-        Tests that the 'name' and 'slug' fields have the correct maximum
-        length.
-        """
-        setattr(self.category, field, 'A' * (max_length + 1))
-        with self.assertRaises(ValidationError):
-            self.category.full_clean()
 
     def test_category_save_generates_slug(self):
         """
@@ -49,3 +37,24 @@ class BlogCategoryModelTest(BlogTestBase):
         Tests that the string representation of a Category object is its name.
         """
         self.assertEqual(str(self.category), self.category.name)
+
+
+class BlogCategoryModelFieldsTest(SimpleTestCase):
+    """
+    Tests for the fields of the Category model that don't need the database.
+    """
+
+    @parameterized.expand([
+        ('name', 255),
+        ('slug', 255),
+    ])
+    def test_category_fields_max_length(self, field, max_length):
+        """
+        Tests that the 'name' and 'slug' fields have the correct maximum
+        length.
+        """
+        category = Category(**{field: 'A' * (max_length + 1)})
+        with self.assertRaises(ValidationError) as context:
+            category.full_clean(
+                validate_unique=False, validate_constraints=False)
+        self.assertIn(field, context.exception.message_dict)
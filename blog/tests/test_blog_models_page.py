@@ -2,6 +2,7 @@
 Tests for the Page model in the blog application.
 """
 from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
 from django.urls import reverse
 from parameterized import parameterized  # type: ignore
 from .test_blog_base import BlogTestBase, Page
@@ -12,9 +13,9 @@ class BlogPageModelTest(BlogTestBase):
     Tests for the Page model.
     """
 
-    def setUp(self) -> None:
-        self.page = self.creating_page()
-        return super().setUp()
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.page = cls.creating_page()
 
     def creating_page_no_defaults(self):
         """
@@ -25,23 +26,10 @@ class BlogPageModelTest(BlogTestBase):
             slug='page_is_published_is_false_by_default',
             content='Creating a unique page for pytest'
         )
-        page.full_clean()
+        page.full_clean(validate_unique=False)
         page.save()
         return page
 
-    @parameterized.expand([
-        ('title', 65),
-        ('slug', 255),
-    ])
-    def test_page_fields_max_length(self, field, max_length):
-        """
-        Tests that the 'title' and 'slug' fields have the correct maximum
-        length.
-        """
-        setattr(self.page, field, 'A' * (max_length + 1))
-        with self.assertRaises(ValidationError):
-            self.page.full_clean()
-
     def test_page_is_published_is_false_by_default(self):
         """
         Tests that the 'is_published' field defaults to False.
@@ -92,3 +80,24 @@ class BlogPageModelTest(BlogTestBase):
         page.save()
         self.assertIsNotNone(page.slug)
         # self.assertEqual(post.slug, slugify_new(post.title, 4))
+
+
+class BlogPageModelFieldsTest(SimpleTestCase):
+    """
+    Tests for the fields of the Page model that don't need the database.
+    """
+
+    @parameterized.expand([
+        ('title', 65),
+        ('slug', 255),
+    ])
+    def test_page_fields_max_length(self, field, max_length):
+        """
+        Tests that the 'title' and 'slug' fields have the correct maximum
+        length.
+        """
+        page = Page(**{field: 'A' * (max_length + 1)})
+        with self.assertRaises(ValidationError) as context:
+            page.full_clean(
+                validate_unique=False, validate_constraints=False)
+        self.assertIn(field, context.exception.message_dict)
@@ -1,8 +1,15 @@
 """
 Tests for the Post model in the blog application.
 """
+import tempfile
+from io import BytesIO
 from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from django.test import SimpleTestCase
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import override_settings
 from django.urls import reverse
+from PIL import Image
 from parameterized import parameterized  # type: ignore
 from utils.rands import slugify_new
 from .test_blog_base import BlogTestBase, Post
@@ -13,40 +20,25 @@ class BlogPostModelTest(BlogTestBase):
     Tests for the Post model.
     """
 
-    def setUp(self) -> None:
-        self.post = self.creating_post()
-        return super().setUp()
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.post = cls.creating_post()
 
     def creating_post_no_defaults(self):
         """
         Creates a Post instance with is_published set to False.
         """
         post = Post(
-            category=self.creating_category(
-                name='Test Default Category', slug='test_default_category'),
+            category_id=self.post.category_id,
             title='Post is_published is false by default',
             slug='post_is_published_is_false_by_default',
             excerpt='Post excerpt',
             content='Criando um post para pytest.',
         )
-        post.full_clean()
+        post.full_clean(validate_unique=False)
         post.save()
         return post
 
-    @parameterized.expand([
-        ('title', 65),
-        ('slug', 255),
-        ('excerpt', 150),
-    ])
-    def test_post_fields_max_length(self, field, max_length):
-        """
-        Tests that the 'title', 'slug', and 'excerpt' fields have the correct
-        maximum length.
-        """
-        setattr(self.post, field, 'A' * (max_length + 1))
-        with self.assertRaises(ValidationError):
-            self.post.full_clean()
-
     def test_post_is_published_is_false_by_default(self):
         """
         Tests that the 'is_published' field defaults to False.
@@ -97,3 +89,112 @@ class BlogPostModelTest(BlogTestBase):
         post.save()
         self.assertIsNotNone(post.slug)
         self.assertNotEqual(post.slug, slugify_new(post.slug, 4))
+
+    def test_post_save_resizes_cover_before_storing_it(self):
+        """
+        Tests that an uploaded cover wider than 900px is resized before it is
+        written to the storage.
+        """
+        buffer = BytesIO()
+        Image.new('RGB', (1800, 900)).save(buffer, format='JPEG')
+        cover = SimpleUploadedFile(
+            'cover.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                post = Post(title='Post With Cover', cover=cover)
+                post.save()
+
+                with Image.open(post.cover.path) as stored_cover:
+                    self.assertEqual(stored_cover.size, (900, 450))
+
+    def test_post_save_stores_small_cover_unchanged(self):
+        """
+        Tests that an uploaded cover narrower than 900px is stored as it was
+        uploaded, the upload still being readable after the size check.
+        """
+        buffer = BytesIO()
+        Image.new('RGB', (300, 150)).save(buffer, format='JPEG')
+        cover = SimpleUploadedFile(
+            'cover.jpg', buffer.getvalue(), content_type='image/jpeg')
+
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                post = Post(title='Post With Cover', cover=cover)
+                post.save()
+
+                with open(post.cover.path, 'rb') as stored_cover:
+                    self.assertEqual(stored_cover.read(), buffer.getvalue())
+
+    @override_settings(FILE_UPLOAD_MAX_SIZE=16)
+    def test_post_cover_larger_than_the_upload_limit_is_rejected(self):
+        """
+        Tests that a cover larger than `FILE_UPLOAD_MAX_SIZE` fails the
+        validation with an error, instead of being dropped silently.
+        """
+        self.post.cover = SimpleUploadedFile(
+            'cover.jpg', b'x' * 17, content_type='image/jpeg')
+
+        with self.assertRaises(ValidationError) as context:
+            self.post.clean_fields(exclude=['title', 'slug', 'excerpt',
+                                            'content', 'category'])
+
+        self.assertEqual(context.exception.message_dict['cover'],
+                         ['File must be at most 16\xa0bytes'])
+
+    def test_post_bulk_apply_tag_tags_all_posts_once(self):
+        """
+        Tests that `bulk_apply_tag` tags all the given posts with one query,
+        skipping the posts that already have the tag.
+        """
+        tag = self.creating_tag()
+        other_post = Post.objects.create(title='Other Post', slug='other')
+        self.post.tags.add(tag)
+
+        with self.assertNumQueries(1):
+            Post.objects.bulk_apply_tag([self.post.pk, other_post.pk], tag.pk)
+
+        self.assertEqual(
+            set(tag.post_set.values_list('pk', flat=True)),
+            {self.post.pk, other_post.pk},
+        )
+
+    def test_post_get_published_returns_a_lazy_queryset(self):
+        """
+        Tests that `get_published` and `get_published_list` return querysets
+        that are not evaluated until they are iterated, so the views can keep
+        them as class attributes and filter them on every request.
+        """
+        self.post.is_published = True
+        self.post.save()
+
+        with self.assertNumQueries(0):
+            published = Post.objects.get_published()
+            published_list = Post.objects.get_published_list()
+
+        self.assertIsInstance(published, QuerySet)
+        self.assertIsInstance(published_list, QuerySet)
+        self.assertEqual(list(published_list.filter(pk=self.post.pk)),
+                         [self.post])
+
+
+class BlogPostModelFieldsTest(SimpleTestCase):
+    """
+    Tests for the fields of the Post model that don't need the database.
+    """
+
+    @parameterized.expand([
+        ('title', 65),
+        ('slug', 255),
+        ('excerpt', 150),
+    ])
+    def test_post_fields_max_length(self, field, max_length):
+        """
+        Tests that the 'title', 'slug', and 'excerpt' fields have the correct
+        maximum length.
+        """
+        post = Post(**{field: 'A' * (max_length + 1)})
+        with self.assertRaises(ValidationError) as context:
+            post.full_clean(
+                validate_unique=False, validate_constraints=False)
+        self.assertIn(field, context.exception.message_dict)
@@ -2,7 +2,9 @@
 Tests for the Tag model in the blog application.
 """
 from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
 from parameterized import parameterized  # type: ignore
+from utils.cache import model_cache_version
 from .test_blog_base import BlogTestBase, Tag
 
 
@@ -11,25 +13,12 @@ class BlogTagModelTest(BlogTestBase):
     Tests for the Tag model.
     """
 
-    def setUp(self) -> None:
-        self.tag = self.creating_tag(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.tag = cls.creating_tag(
             name='Tag Testing',
             slug='tag_testing',
         )
-        return super().setUp()
-
-    @parameterized.expand([
-        ('name', 255),
-        ('slug', 255),
-    ])
-    def test_tag_fields_max_length(self, field, max_length):
-        """
-        Tests that the 'name' and 'slug' fields have the correct maximum
-        length.
-        """
-        setattr(self.tag, field, 'A' * (max_length + 1))
-        with self.assertRaises(ValidationError):
-            self.tag.full_clean()
 
     def test_tag_save_generates_slug(self):
         """
@@ -41,6 +30,32 @@ class BlogTagModelTest(BlogTestBase):
         self.assertIsNotNone(tag.slug)
         # self.assertEqual(post.slug, slugify_new(post.title, 4))
 
+    def test_tag_bulk_create_with_slugs_generates_slugs(self):
+        """
+        Tests that `bulk_create_with_slugs` generates the missing slugs and
+        creates all the tags with a single `INSERT`.
+        """
+        tags = [Tag(name=f'Bulk Tag {i}') for i in range(5)]
+        with self.assertNumQueries(2):
+            Tag.objects.bulk_create_with_slugs(tags)
+
+        slugs = set(Tag.objects.filter(
+            name__startswith='Bulk Tag').values_list('slug', flat=True))
+        self.assertEqual(len(slugs), 5)
+        self.assertTrue(all(slug.startswith('bulk-tag-') for slug in slugs))
+
+    def test_tag_bulk_create_with_slugs_invalidates_the_tag_cache(self):
+        """
+        Tests that `bulk_create_with_slugs` starts a new cache version for
+        the tags, as saving a tag does, since `bulk_create` sends no
+        `post_save` signal.
+        """
+        version = model_cache_version(Tag)
+
+        Tag.objects.bulk_create_with_slugs([Tag(name='Bulk Tag')])
+
+        self.assertNotEqual(model_cache_version(Tag), version)
+
     def test_tag_string_representation(self):
         """
         Tests that the string representation of a Tag object is its name.
@@ -53,3 +68,24 @@ class BlogTagModelTest(BlogTestBase):
             str(self.tag), needed,
             msg=f'Tag string representation must be'
             f'"{needed}" but "{str(self.tag)}" was received.')
+
+
+class BlogTagModelFieldsTest(SimpleTestCase):
+    """
+    Tests for the fields of the Tag model that don't need the database.
+    """
+
+    @parameterized.expand([
+        ('name', 255),
+        ('slug', 255),
+    ])
+    def test_tag_fields_max_length(self, field, max_length):
+        """
+        Tests that the 'name' and 'slug' fields have the correct maximum
+        length.
+        """
+        tag = Tag(**{field: 'A' * (max_length + 1)})
+        with self.assertRaises(ValidationError) as context:
+            tag.full_clean(
+                validate_unique=False, validate_constraints=False)
+        self.assertIn(field, context.exception.message_dict)
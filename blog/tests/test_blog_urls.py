@@ -1,13 +1,14 @@
 """
 Tests that the URL patterns defined in the blog application's `urls.py` file
-are reversed correctly using Django's `reverse` function. Each test checks if
-the generated URL matches the expected path.
+are reversed correctly using Django's `reverse` function and resolve to the
+correct view classes. None of these tests need the database.
 """
-from django.test import TestCase
-from django.urls import reverse
+from django.test import SimpleTestCase
+from django.urls import reverse, resolve
+from blog import views
 
 
-class BlogURLsTest(TestCase):
+class BlogURLsTest(SimpleTestCase):
     """
     Tests that URL patterns in the blog application are reversed correctly.
     """
@@ -59,3 +60,68 @@ class BlogURLsTest(TestCase):
         '''
         url = reverse('blog:search')
         self.assertEqual(url, '/search/')
+
+
+class BlogURLsResolveTest(SimpleTestCase):
+    """
+    Tests that URL patterns in the blog application resolve to the correct
+    view classes.
+    """
+
+    def test_index_view_function_is_correct(self):
+        """
+        Verifies that the blog index view function is mapped correctly to the
+        'blog:index' URL.
+        """
+        view = resolve(reverse('blog:index'))
+        self.assertIs(view.func.view_class, views.PostListView)
+
+    def test_post_detail_view_function_is_correct(self):
+        """
+        Verifies that the blog post view function is mapped correctly to the
+        'blog:post' URL with a slug.
+        """
+        view = resolve(reverse('blog:post', kwargs={'slug': 'teste_post'}))
+        self.assertIs(view.func.view_class, views.PostDetailView)
+
+    def test_page_detail_view_function_is_correct(self):
+        """
+        Verifies that the blog page view function is mapped correctly to the
+        'blog:page' URL with a slug.
+        """
+        view = resolve(reverse('blog:page', kwargs={'slug': 'teste_page'}))
+        self.assertIs(view.func.view_class, views.PageDetailView)
+
+    def test_blog_category_view_function_is_correct(self):
+        """
+        Verifies that the blog posts by category view function is mapped
+        correctly to the 'blog:category' URL with a slug.
+        """
+        view = resolve(reverse(
+            'blog:category', kwargs={'slug': 'teste_category'}
+        ))
+        self.assertIs(view.func.view_class, views.CategoryListView)
+
+    def test_blog_created_by_view_function_is_correct(self):
+        """
+        Verifies that the blog posts by author view function is mapped
+        correctly to the 'blog:created_by' URL with an author primary key.
+        """
+        view = resolve(reverse('blog:created_by', kwargs={'author_pk': 1}))
+        self.assertIs(view.func.view_class, views.CreateByListView)
+
+    def test_blog_tag_view_function_is_correct(self):
+        """
+        Verifies that the blog posts by tag view function is mapped correctly
+        to the 'blog:tag' URL with a slug.
+        """
+        view = resolve(reverse('blog:tag', kwargs={'slug': 'teste_tag'}))
+        self.assertIs(view.func.view_class, views.TagListView)
+
+    def test_blog_search_uses_correct_view_function(self):
+        """
+        Verifies that the blog search view function is mapped correctly to the
+        'blog:search' URL.
+        """
+        view = resolve(reverse('blog:search'))
+        self.assertIs(view.func.view_class, views.SearchListView)
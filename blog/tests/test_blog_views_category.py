@@ -1,11 +1,9 @@
 """
-This test class validates that the URL patterns defined in the `blog`
-application resolve to the correct view classes using Django's `reverse` and
-`resolve` functions. Each test method checks if the URL pattern maps to the
-intended view class.
+Tests the blog category view, ensuring it returns 404 for unknown categories
+and renders the posts of the requested category. The URL resolution is tested
+in `test_blog_urls.py`.
 """
-from django.urls import reverse, resolve
-from blog import views
+from django.urls import reverse
 from .test_blog_base import BlogTestBase
 
 
@@ -14,16 +12,6 @@ class BlogViewsCategoryTest(BlogTestBase):
     Tests the URL mapping for the blog category views.
     """
 
-    def test_blog_category_view_function_is_correct(self):
-        """
-        Verifies that the blog posts by category view function is mapped
-        correctly to the 'blog:category' URL with a slug.
-        """
-        view = resolve(reverse(
-            'blog:category', kwargs={'slug': 'teste_category'}
-        ))
-        self.assertIs(view.func.view_class, views.CategoryListView)
-
     def test_blog_category_returns_404_if_no_category_found(self):
         """
         Tests if the category view returns 404 when no category is found.
@@ -58,6 +46,46 @@ class BlogViewsCategoryTest(BlogTestBase):
             'blog:category', kwargs={'slug': post.category.slug})
         )
         self.assertTemplateUsed(response, 'blog/pages/index.html')
-        self.assertIn(needed_name, response.content.decode('utf-8'))
+        self.assertContains(response, needed_name)
         self.assertEqual(
             response.context['posts'].first().category.name, needed_name)
+
+    def test_blog_category_queries_do_not_grow_with_the_posts(self):
+        """
+        Tests if the category view reads the category name once, instead of
+        loading it through the posts of the listing.
+        """
+        category = self.creating_category()
+        author = self.creating_author()
+        for i in range(3):
+            self.creating_post(
+                title=f'Post Title {i}', slug=f'post_title_{i}',
+                category=category, author=author,
+            )
+        url = reverse('blog:category', kwargs={'slug': category.slug})
+
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+
+        self.assertContains(response, 'Test Category - Categoria - ')
+
+    def test_category_name_is_cached_until_the_category_changes(self):
+        """
+        Tests if the category name is read from the cache on the following
+        requests, and read again after the category is renamed.
+        """
+        category = self.creating_category()
+        self.creating_post(category=category)
+        url = reverse('blog:category', kwargs={'slug': category.slug})
+        self.client.get(url)
+
+        # Only the posts check of `allow_empty` is left, the count, the cards
+        # and the site setup are cached too.
+        with self.assertNumQueries(1):
+            self.client.get(url)
+
+        category.name = 'Renamed Category'
+        category.save()
+        response = self.client.get(url)
+
+        self.assertContains(response, 'Renamed Category - Categoria - ')
@@ -2,8 +2,9 @@
 Tests URL mapping for blog views related to posts created by a specific author.
 Ensures they resolve to the correct view classes.
 """
-from django.urls import reverse, resolve
-from blog import views
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from .test_blog_base import BlogTestBase
 
 
@@ -13,14 +14,6 @@ class BlogViewsCreatedByTest(BlogTestBase):
     specific author.
     """
 
-    def test_blog_created_by_view_function_is_correct(self):
-        """
-        Verifies that the blog posts by author view function is mapped
-        correctly to the 'blog:created_by' URL with an author primary key.
-        """
-        view = resolve(reverse('blog:created_by', kwargs={'author_pk': 1}))
-        self.assertIs(view.func.view_class, views.CreateByListView)
-
     def test_blog_created_by_returns_404_if_no_created_by_found(self):
         """
         Tests if the view returns 404 when no author is found for the provided
@@ -50,9 +43,48 @@ class BlogViewsCreatedByTest(BlogTestBase):
         response = self.client.get(
             reverse('blog:created_by', args=(1,))
         )
-        response_content = response.content.decode('utf-8')
         # response_context_created_by = response.context['created_by']
 
         self.assertTemplateUsed(response, 'blog/pages/index.html')
-        self.assertIn('user name', response_content)
+        self.assertContains(response, 'user name')
         self.assertEqual(response.context['post'], created_by)
+
+    def test_created_by_view_loads_only_the_author_name(self):
+        """
+        Tests if the view loads only the name columns of the author, without
+        the password hash and the other columns of `auth_user`.
+        """
+        author = self.creating_author()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('blog:created_by', kwargs={'author_pk': author.pk})
+            )
+
+        self.assertContains(response, 'Posts de user name - ')
+        user_queries = [
+            q['sql'] for q in queries if 'FROM "auth_user"' in q['sql']
+        ]
+        self.assertEqual(len(user_queries), 1)
+        self.assertNotIn('"auth_user"."password"', user_queries[0])
+
+    def test_created_by_author_is_cached_until_the_author_changes(self):
+        """
+        Tests if the author is read from the cache on the following requests,
+        and read again after the author is renamed.
+        """
+        author = self.creating_author()
+        url = reverse('blog:created_by', kwargs={'author_pk': author.pk})
+        self.client.get(url)
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+
+        self.assertFalse(
+            any('FROM "auth_user"' in q['sql'] for q in queries))
+
+        author.first_name = 'renamed'
+        author.save()
+        response = self.client.get(url)
+
+        self.assertContains(response, 'Posts de renamed name - ')
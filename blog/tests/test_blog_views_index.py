@@ -2,8 +2,12 @@
 Tests URL mapping for the blog index view, ensuring it resolves to the correct
 view class and renders the expected template.
 """
-from django.urls import reverse, resolve
-from blog import views
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from parameterized import parameterized  # type: ignore
+from site_setup.models import MenuLink, SiteSetup
 from .test_blog_base import BlogTestBase
 
 
@@ -12,26 +16,25 @@ class BlogViewsIndexTest(BlogTestBase):
     Tests the URL mapping for the blog index view.
     """
 
-    def test_index_view_function_is_correct(self):
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
-        Verifies that the blog index view function is mapped correctly to the
-        'blog:index' URL.
+        Reverses the index URL once for the whole class.
         """
-        view = resolve(reverse('blog:index'))
-        self.assertIs(view.func.view_class, views.PostListView)
+        cls.index_url = reverse('blog:index')
 
     def test_index_view_returns_status_code_200(self):
         """
         Tests if the index view returns status code 200.
         """
-        response = self.client.get(reverse('blog:index'))
+        response = self.client.get(self.index_url)
         self.assertEqual(response.status_code, 200)
 
     def test_index_view_loads_template(self):
         """
         Tests if the index view loads the correct template.
         """
-        response = self.client.get(reverse('blog:index'))
+        response = self.client.get(self.index_url)
         self.assertTemplateUsed(response, 'blog/pages/index.html')
 
     def test_index_shows_no_posts_message(self):
@@ -39,11 +42,9 @@ class BlogViewsIndexTest(BlogTestBase):
         Tests if the index template displays "No posts found" message when
         there are no published posts.
         """
-        response = self.client.get(reverse('blog:index'))
-        self.assertIn(
-            '<h1>Nenhum post encontrado aqui 🥲</h1>',
-            response.content.decode('utf-8')
-        )
+        response = self.client.get(self.index_url)
+        self.assertContains(
+            response, '<h1>Nenhum post encontrado aqui 🥲</h1>')
 
     def test_index_template_loads_post(self):
         """
@@ -51,14 +52,13 @@ class BlogViewsIndexTest(BlogTestBase):
         post exists.
         """
         self.creating_post()
-        response = self.client.get(reverse('blog:index'))
-        response_content = response.content.decode('utf-8')
+        response = self.client.get(self.index_url)
         response_context_post = response.context['posts']
         self.assertEqual(len(response_context_post), 1)
         self.assertEqual(response_context_post.first().title, 'Post Title')
-        self.assertIn('Post Title', response_content)
-        self.assertIn('post_title', response_content)
-        self.assertIn('Post excerpt', response_content)
+        self.assertContains(response, 'Post Title')
+        self.assertContains(response, 'post_title')
+        self.assertContains(response, 'Post excerpt')
 
     def test_index_does_not_load_unpublished_post(self):
         """
@@ -67,10 +67,112 @@ class BlogViewsIndexTest(BlogTestBase):
         """
         self.creating_post(is_published=False)
 
-        response = self.client.get(reverse('blog:index'))
-        response_content = response.content.decode('utf-8')
+        response = self.client.get(self.index_url)
 
-        self.assertIn(
-            '<h1>Nenhum post encontrado aqui 🥲</h1>',
-            response_content
-        )
+        self.assertContains(
+            response, '<h1>Nenhum post encontrado aqui 🥲</h1>')
+
+    def test_index_paginates_posts(self):
+        """
+        Tests if the index shows at most 9 posts per page.
+        """
+        self.creating_posts_in_batch(10)
+
+        response = self.client.get(self.index_url)
+        self.assertEqual(len(response.context['posts']), 9)
+
+        response = self.client.get(self.index_url + '?page=2')
+        self.assertEqual(len(response.context['posts']), 1)
+
+    def test_index_does_not_load_post_content(self):
+        """
+        Tests if the index loads the posts without their `content`, which is
+        not displayed in the post cards, and without a query per post.
+        """
+        self.creating_posts_in_batch(9)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.index_url)
+
+        self.assertContains(response, 'Post Title 8')
+        self.assertLessEqual(len(queries), 3)
+        for query in queries:
+            self.assertNotIn('"blog_post"."content"', query['sql'])
+
+    def test_index_caches_the_rendered_posts(self):
+        """
+        Tests if the index reuses the rendered listing and the number of
+        posts on the next request, without querying the posts again.
+        """
+        self.creating_posts_in_batch(3)
+        self.client.get(self.index_url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.index_url)
+
+        self.assertContains(response, 'Post Title 2')
+        for query in queries:
+            self.assertNotIn('"blog_post"', query['sql'])
+
+    def test_index_cache_ignores_unknown_query_parameters(self):
+        """
+        Tests if a request with a query string parameter that doesn't change
+        the listing reuses the cached listing instead of adding an entry.
+        """
+        self.creating_posts_in_batch(3)
+        self.client.get(self.index_url)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.index_url, {'x': '1'})
+
+        self.assertContains(response, 'Post Title 2')
+        for query in queries:
+            self.assertNotIn('"blog_post"', query['sql'])
+
+    def test_index_cache_is_invalidated_when_a_post_is_saved(self):
+        """
+        Tests if the cached listing is rendered again after a post changes.
+        """
+        post = self.creating_post()
+        self.client.get(self.index_url)
+
+        post.title = 'Updated Post Title'
+        post.save()
+        response = self.client.get(self.index_url)
+
+        self.assertContains(response, 'Updated Post Title')
+
+    def test_index_cache_is_invalidated_by_bulk_created_posts(self):
+        """
+        Tests if the cached listing shows the posts created with
+        `bulk_create_with_slugs`, which sends no `post_save` signal.
+        """
+        self.client.get(self.index_url)
+
+        self.creating_posts_in_batch(3)
+        response = self.client.get(self.index_url)
+
+        self.assertContains(response, 'Post Title 2')
+
+    @parameterized.expand([(1,), (10,), (100,)])
+    def test_index_query_count_does_not_grow_with_the_menu(self, links):
+        """
+        Tests if the site setup and its menu links are read with a constant
+        number of queries, whatever the number of links, and are then served
+        from the cache.
+        """
+        site_setup = SiteSetup.objects.create(
+            title='Site Title', description='Site description')
+        MenuLink.objects.bulk_create([
+            MenuLink(text=f'Link {i}', url_or_path='/', site_setup=site_setup)
+            for i in range(links)
+        ])
+        cache.clear()
+
+        # The site setup, its menu links and the count of the posts.
+        with self.assertNumQueries(3):
+            response = self.client.get(self.index_url)
+        self.assertContains(response, f'Link {links - 1}')
+
+        with self.assertNumQueries(0):
+            self.client.get(self.index_url)
@@ -2,8 +2,9 @@
 Tests URL mapping for the blog page detail view, ensuring it resolves to the
 correct view class and renders the expected template.
 """
-from django.urls import reverse, resolve
-from blog import views
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from .test_blog_base import BlogTestBase
 
 
@@ -12,14 +13,6 @@ class BlogViewsPageTest(BlogTestBase):
     Tests the URL mapping for the blog page detail view.
     """
 
-    def test_page_detail_view_function_is_correct(self):
-        """
-        Verifies that the blog page view function is mapped correctly to the
-        'blog:page' URL with a slug.
-        """
-        view = resolve(reverse('blog:page', kwargs={'slug': 'teste_page'}))
-        self.assertIs(view.func.view_class, views.PageDetailView)
-
     def test_page_detail_view_returns_404_if_not_found(self):
         """
         Tests if the page detail view returns 404 when no page is found for the
@@ -53,11 +46,10 @@ class BlogViewsPageTest(BlogTestBase):
         response = self.client.get(reverse(
             'blog:page', kwargs={'slug': page.slug})
         )
-        response_content = response.content.decode('utf-8')
         response_context_page = response.context['page']
 
         self.assertTemplateUsed(response, 'blog/pages/page.html')
-        self.assertIn(needed_title, response_content)
+        self.assertContains(response, needed_title)
         self.assertEqual(response_context_page, page)
 
     def test_page_detail_view_returns_404_for_unpublished_page(self):
@@ -70,3 +62,19 @@ class BlogViewsPageTest(BlogTestBase):
             'blog:page', kwargs={'slug': page.slug})
         )
         self.assertEqual(response.status_code, 404)
+
+    def test_page_detail_loads_the_page_once(self):
+        """
+        Tests if the page detail view reuses the page it looked up to build
+        the page title, instead of querying it again.
+        """
+        page = self.creating_page()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(page.get_absolute_url())
+
+        self.assertContains(response, 'Page title - Página - ')
+        page_queries = [
+            q['sql'] for q in queries if 'FROM "blog_page"' in q['sql']
+        ]
+        self.assertEqual(len(page_queries), 1)
@@ -2,8 +2,9 @@
 Tests URL mapping for the blog post detail view, ensuring it resolves to the
 correct view class and renders the expected template.
 """
-from django.urls import reverse, resolve
-from blog import views
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from .test_blog_base import BlogTestBase
 
 
@@ -12,13 +13,14 @@ class BlogViewsPostTest(BlogTestBase):
     Tests the URL mapping for the blog post detail view.
     """
 
-    def test_post_detail_view_function_is_correct(self):
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
-        Verifies that the blog post view function is mapped correctly to the
-        'blog:post' URL with a slug.
+        Creates a published post with a tag, shared by the tests that only
+        need any published post.
         """
-        view = resolve(reverse('blog:post', kwargs={'slug': 'teste_post'}))
-        self.assertIs(view.func.view_class, views.PostDetailView)
+        cls.post = cls.creating_post()
+        cls.post.tags.add(cls.creating_tag())
 
     def test_post_detail_view_returns_404_if_not_found(self):
         """
@@ -35,9 +37,8 @@ class BlogViewsPostTest(BlogTestBase):
         Tests if the post detail view returns status code 200 when a valid
         post slug is provided.
         """
-        post = self.creating_post()
         response = self.client.get(reverse(
-            'blog:post', kwargs={'slug': post.slug})
+            'blog:post', kwargs={'slug': self.post.slug})
         )
         self.assertEqual(response.status_code, 200)
 
@@ -52,13 +53,10 @@ class BlogViewsPostTest(BlogTestBase):
         response = self.client.get(reverse(
             'blog:post', kwargs={'slug': needed_slug})
         )
-        # response = self.client.get(f'http://127.0.0.1:8000/post/{post.slug}
-        # /')
-        response_content = response.content.decode('utf-8')
         response_context_post = response.context['post']
 
         self.assertTemplateUsed(response, 'blog/pages/post.html')
-        self.assertIn(needed_title, response_content)
+        self.assertContains(response, needed_title)
         self.assertEqual(response_context_post, post)
 
     def test_post_detail_view_returns_404_for_unpublished_post(self):
@@ -66,8 +64,30 @@ class BlogViewsPostTest(BlogTestBase):
         Tests if the post detail view returns 404 when trying to access an
         unpublished post.
         """
-        post = self.creating_post(is_published=False)
+        post = self.creating_post(
+            title='Unpublished post', slug='unpublished_post',
+            is_published=False,
+        )
         response = self.client.get(reverse(
             'blog:post', kwargs={'slug': post.slug})
         )
         self.assertEqual(response.status_code, 404)
+
+    def test_post_detail_loads_author_category_and_tags_with_the_post(self):
+        """
+        Tests if the post detail view loads the author and the category with
+        the post and the tags in one batch, instead of querying each of them
+        while the template is rendered.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.post.get_absolute_url())
+
+        self.assertContains(response, 'Test Tag')
+        self.assertContains(response, 'Test Category')
+        lazy_queries = [
+            q['sql'] for q in queries
+            if q['sql'].startswith(('SELECT "auth_user"',
+                                    'SELECT "blog_category"'))
+            or ('"blog_tag"' in q['sql'] and 'LIMIT 1' in q['sql'])
+        ]
+        self.assertEqual(lazy_queries, [])
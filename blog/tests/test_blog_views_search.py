@@ -2,8 +2,10 @@
 Tests URL mapping for the blog search view, ensuring it resolves to the
 correct view class and renders the expected template.
 """
-from django.urls import reverse, resolve
-from blog import views
+from unittest import skipUnless
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
 from .test_blog_base import BlogTestBase
 
 
@@ -12,42 +14,41 @@ class BlogViewsSearchTest(BlogTestBase):
     Test class to verify that blog view functions are mapped correctly to URLs.
     """
 
-    def test_blog_search_uses_correct_view_function(self):
+    @classmethod
+    def setUpTestData(cls) -> None:
         """
-        Verifies that the blog search view function is mapped correctly to the
-        'blog:search' URL.
+        Reverses the search and index URLs once for the whole class.
         """
-        response = resolve(reverse('blog:search'))
-        self.assertIs(response.func.view_class, views.SearchListView)
+        cls.search_url = reverse('blog:search')
+        cls.index_url = reverse('blog:index')
 
     def test_blog_search_no_results_found_shows_message(self):
         """
         Tests that searching for a non-existent term displays an appropriate
         message indicating no posts were found.
         """
-        url = reverse('blog:search') + '?q=teste'
+        url = self.search_url + '?q=teste'
         response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
-        self.assertIn(
-            '<h1>Nenhum post encontrado aqui 🥲</h1>',
-            response.content.decode('utf-8')
-        )
+        self.assertContains(
+            response, '<h1>Nenhum post encontrado aqui 🥲</h1>')
 
     def test_blog_search_empty_query_redirects_to_index(self):
         """
         Tests that an empty search query redirects to the blog index page.
         """
-        url = reverse('blog:search') + '?q=+'
+        url = self.search_url + '?q=+'
         response = self.client.get(url)
         self.assertEqual(response.status_code, 302)
-        self.assertEqual(response.url, reverse('blog:index'))
+        self.assertEqual(response.url, self.index_url)
 
     def test_blog_search_loads_correct_template(self):
         """
         Tests if the search view loads the correct template.
         """
-        response = self.client.get(reverse('blog:index'))
-        self.assertTemplateUsed(response, 'blog/base.html')
+        response = self.client.get(self.search_url + '?q=teste')
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'blog/pages/index.html')
 
     def test_blog_search_can_find_recipe_by_title(self):
         """
@@ -72,12 +73,12 @@ class BlogViewsSearchTest(BlogTestBase):
         )
         post2 = self.creating_post(
             category_data=category2, title=title2, slug=slug2,
+            author=post1.created_by,
         )
 
-        search_url = reverse('blog:search')
-        response1 = self.client.get(f'{search_url}?q={title1}')
-        response2 = self.client.get(f'{search_url}?q={title2}')
-        response_both = self.client.get(f'{search_url}?q=this')
+        response1 = self.client.get(f'{self.search_url}?q={title1}')
+        response2 = self.client.get(f'{self.search_url}?q={title2}')
+        response_both = self.client.get(f'{self.search_url}?q=this')
 
         self.assertIn(post1, response1.context['posts'])
         self.assertNotIn(post2, response1.context['posts'])
@@ -87,3 +88,99 @@ class BlogViewsSearchTest(BlogTestBase):
 
         self.assertIn(post1, response_both.context['posts'])
         self.assertIn(post2, response_both.context['posts'])
+
+    def test_blog_search_matches_every_word_in_any_order(self):
+        """
+        Tests if the search view finds the posts that contain all the words
+        of the query, even when they are apart or in another order, and
+        skips the posts missing one of them.
+        """
+        post = self.creating_post(
+            title='Django ORM tips', slug='django_orm_tips',
+            excerpt='Queries made simple',
+        )
+        self.creating_post(
+            title='Django views', slug='django_views',
+            author=post.created_by, category=post.category,
+        )
+
+        response = self.client.get(f'{self.search_url}?q=simple+django')
+
+        self.assertEqual(list(response.context['posts']), [post])
+
+    def test_blog_search_paginates_results(self):
+        """
+        Tests if the search view shows at most 9 posts per page and the
+        remaining results on the next pages.
+        """
+        self.creating_posts_in_batch(10)
+
+        response = self.client.get(f'{self.search_url}?q=post+title')
+        self.assertEqual(len(response.context['posts']), 9)
+        self.assertEqual(response.context['search_url'], '&q=post+title')
+
+        response = self.client.get(f'{self.search_url}?q=post+title&page=2')
+        self.assertEqual(len(response.context['posts']), 1)
+
+    def test_blog_search_queries_do_not_grow_with_the_results(self):
+        """
+        Tests if the search view runs the same queries however many posts it
+        lists: the count of the paginator, the page of posts and the site
+        setup, without a query per post.
+        """
+        self.creating_posts_in_batch(9)
+
+        with self.assertNumQueries(3):
+            response = self.client.get(f'{self.search_url}?q=post+title')
+
+        self.assertEqual(len(response.context['posts']), 9)
+
+    def test_blog_search_too_short_query_lists_no_posts(self):
+        """
+        Tests if a one letter query, which would match nearly every post,
+        lists no posts without querying them.
+        """
+        self.creating_post()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(f'{self.search_url}?q=p')
+
+        self.assertContains(
+            response, '<h1>Nenhum post encontrado aqui 🥲</h1>')
+        for query in queries:
+            self.assertNotIn('"blog_post"', query['sql'])
+
+    @skipUnless(connection.vendor == 'postgresql', 'Ranked on PostgreSQL')
+    def test_blog_search_orders_results_by_rank(self):
+        """
+        Tests if the search view lists the posts that match the query in
+        their title before the newer posts that only mention it in their
+        content, even several times, as the title is weighted higher.
+        """
+        best = self.creating_post(
+            title='Django ORM', slug='django_orm', excerpt='Post excerpt',
+            content='Post content.',
+        )
+        self.creating_post(
+            title='Other post', slug='other_post',
+            content='Django ORM, django orm and more django orm.',
+            category=best.category, author=best.created_by,
+        )
+
+        response = self.client.get(f'{self.search_url}?q=django+orm')
+
+        self.assertEqual(response.context['posts'][0], best)
+
+    @skipUnless(connection.vendor == 'postgresql', 'Full-text search')
+    def test_blog_search_finds_other_inflections_of_the_words(self):
+        """
+        Tests if the search view finds the posts that contain another
+        inflection of the searched word, through the full-text search.
+        """
+        post = self.creating_post(
+            title='Meu gato', slug='meu_gato', content='Um gato dormindo.',
+        )
+
+        response = self.client.get(f'{self.search_url}?q=gatos')
+
+        self.assertEqual(list(response.context['posts']), [post])
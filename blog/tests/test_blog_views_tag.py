@@ -2,7 +2,7 @@
 Tests URL mapping for the blog tag view, ensuring it resolves to the correct
 view class.
 """
-from django.urls import reverse, resolve
+from django.urls import reverse
 from blog import views
 from .test_blog_base import BlogTestBase, Post, Tag
 
@@ -12,27 +12,19 @@ class BlogViewsTagTest(BlogTestBase):
     Tests the URL mapping for the blog tag view.
     """
 
-    def setUp(self) -> None:
-        self.tag = Tag.objects.create(
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.tag = Tag.objects.create(
             name='Test Tag',
             slug='test_tag',
         )
-        self.post = Post.objects.create(
+        cls.post = Post.objects.create(
             title='Test Post',
             slug='test_post',
             content='Test post content',
             is_published=True,
         )
-        self.post.tags.set([self.tag])
-        return super().setUp()
-
-    def test_blog_tag_view_function_is_correct(self):
-        """
-        Verifies that the blog posts by tag view function is mapped correctly
-        to the 'blog:tag' URL with a slug.
-        """
-        view = resolve(reverse('blog:tag', kwargs={'slug': 'teste_tag'}))
-        self.assertIs(view.func.view_class, views.TagListView)
+        cls.post.tags.set([cls.tag])
 
     def test_blog_tag_returns_404_if_not_found(self):
         """
@@ -61,3 +53,31 @@ class BlogViewsTagTest(BlogTestBase):
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'Test Tag - Tag - ')
         self.assertContains(response, 'Test Tag')
+
+    def test_tag_list_view_reads_the_tag_once(self):
+        """
+        Tests if the tag view reads the tag name with a single query, without
+        running the listing query again.
+        """
+        url = reverse('blog:tag', kwargs={'slug': 'test_tag'})
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertContains(response, 'Test Tag - Tag - ')
+
+    def test_tag_list_view_cache_is_invalidated_by_bulk_apply_tag(self):
+        """
+        Tests if the cached tag listing shows the posts tagged with
+        `bulk_apply_tag`, which sends no `m2m_changed` signal.
+        """
+        url = reverse('blog:tag', kwargs={'slug': 'test_tag'})
+        other_post = Post.objects.create(
+            title='Bulk Tagged Post', slug='bulk_tagged_post',
+            content='Test post content', is_published=True,
+        )
+        response = self.client.get(url)
+        self.assertNotContains(response, 'Bulk Tagged Post')
+
+        Post.objects.bulk_apply_tag([other_post.pk], self.tag.pk)
+        response = self.client.get(url)
+
+        self.assertContains(response, 'Bulk Tagged Post')
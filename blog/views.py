@@ -2,19 +2,50 @@
 This file contains class-based views for managing blog content, including posts
 , pages, and search functionality.
 """
+import operator
 import re
+from functools import reduce
 from typing import Any
+from urllib.parse import urlencode
 from django.db.models.query import QuerySet
 from django.views.generic import ListView, DetailView
+from django.core.cache import cache
 from django.shortcuts import redirect
-from django.db.models import Q
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db import connection
+from django.db.models import Exists, F, OuterRef, Q, TextField, Value
+from django.db.models.functions import Concat
 from django.contrib.auth.models import User
 from django.http import Http404, HttpRequest, HttpResponse
-from blog.models import Post, Page
+from blog.models import Category, Post, Page, Tag
+from utils.cache import model_cache_version
+from utils.paginators import CachedCountPaginator
 
 
 PER_PAGE = 9
 
+# Seconds the authors, categories and tags of the listings are cached.
+LOOKUP_CACHE_TIMEOUT = 300
+
+# Characters replaced by spaces in the search query.
+_NON_WORD_RE = re.compile(r'[^\w\s]')
+
+
+def _cached_lookup(model, lookup, default):
+    """
+    Return the cached result of a lookup on the model, calling `default` to
+    run it when it is not cached. The entry is keyed by the cache version of
+    the model, so it is dropped as soon as an object of the model changes.
+
+    :param model: The model class looked up.
+    :param lookup: The part of the cache key identifying the lookup.
+    :param default: The callable running the lookup.
+    :return: The result of the lookup.
+    """
+    key = (f'{model._meta.label_lower}:{lookup}:'
+           f'{model_cache_version(model)}')
+    return cache.get_or_set(key, default, LOOKUP_CACHE_TIMEOUT)
+
 
 class PostListView(ListView):
     """
@@ -32,11 +63,15 @@ class PostListView(ListView):
         ordering: The default ordering for the posts (by primary key in
                   descending order).
         paginate_by: The number of posts displayed per page.
-        queryset: The queryset of published posts.
+        paginator_class: The paginator, which caches the number of posts
+                         until a post changes.
+        queryset: The queryset of published posts, loading only the columns
+                  used by the post cards.
     Methods:
         get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-            Overrides the default method to add a custom `page_title` to the
-            context.
+            Overrides the default method to add a custom `page_title` and the
+            cache version of the posts, which keys the cached listing of the
+            template, to the context.
             Returns the context data for the template.
     """
     model: type[Post] = Post
@@ -44,11 +79,14 @@ class PostListView(ListView):
     context_object_name: str = 'posts'
     ordering: str = '-pk'
     paginate_by: int = PER_PAGE
-    queryset: QuerySet[Post] = Post.objects.get_published()  # type: ignore
+    paginator_class: type = CachedCountPaginator
+    queryset: QuerySet[Post] = (
+        Post.objects.get_published_list())  # type: ignore
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         context = super().get_context_data(**kwargs)
         context['page_title'] = 'Home -'
+        context['post_cache_version'] = model_cache_version(Post)
         return context
 
 
@@ -78,8 +116,8 @@ class CreateByListView(PostListView):
         get(self, request: HttpRequest, *args: Any,
         **kwargs: Any) -> HttpResponse:
             Handles GET requests, retrieves the author from the request URL,
-            and filters the queryset if an author is found. Raises a 404 error
-            if the author is not found.
+            cached until a user changes, and filters the queryset if an author
+            is found. Raises a 404 error if the author is not found.
     """
 
     def __init__(self, **kwargs: Any) -> None:
@@ -108,16 +146,15 @@ class CreateByListView(PostListView):
             self, request: HttpRequest, *args: Any, **kwargs: Any
     ) -> HttpResponse:
         author_pk = self.kwargs.get('author_pk')
-        user = User.objects.filter(pk=author_pk).first()
-
+        user = _cached_lookup(
+            User, f'pk:{author_pk}',
+            lambda: User.objects.only(
+                'username', 'first_name', 'last_name'
+            ).filter(pk=author_pk).first(),
+        )
         if user is None:
-            # return redirect('blog:index') if you want to redirect
-            raise Http404()
-
-        self._temp_context.update({
-            'author_pk': author_pk,
-            'user': user,
-        })
+            raise Http404("Autor não encontrado")
+        self._temp_context.update({'user': user, })
 
         return super().get(request, *args, **kwargs)
 
@@ -143,7 +180,9 @@ class CategoryListView(PostListView):
             Returns the filtered queryset of posts.
         get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             Overrides the parent method to add a custom `page_title`
-            based on the category name.
+            based on the category name, read with a single query instead of
+            loading the first post and then its category, and cached until a
+            category changes.
             Returns the context data for the template.
     """
     allow_empty: bool = False
@@ -155,7 +194,14 @@ class CategoryListView(PostListView):
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
-        page_title = f'{self.object_list[0].category.name} - Categoria - '
+        slug = self.kwargs.get('slug')
+        category_name = _cached_lookup(
+            Category, f'name:{slug}',
+            lambda: Category.objects.filter(
+                slug=slug
+            ).values_list('name', flat=True).first(),
+        )
+        page_title = f'{category_name} - Categoria - '
         ctx.update({'page_title': page_title, })
         return ctx
 
@@ -182,33 +228,38 @@ class TagListView(PostListView):
             Returns the filtered queryset of posts.
         get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             Overrides the parent method to add a custom `page_title`
-            based on the tag name and handles cases where the tag
-            doesn't exist or no posts are found for that tag.
+            based on the tag name, read with a single query and cached
+            until a tag changes, and raises a
+            404 error if the tag doesn't exist. Listings without posts are
+            already rejected by `allow_empty`.
             Returns the context data for the template.
     """
     allow_empty: bool = False
 
     def get_queryset(self) -> QuerySet[Any]:  # type: ignore
+        # A semi-join on the through table instead of joining the posts to
+        # their tags.
+        tagged = Post.tags.through.objects.filter(
+            post_id=OuterRef('pk'), tag__slug=self.kwargs.get('slug'),
+        )
         return super().get_queryset().filter(  # type: ignore
-            tags__slug=self.kwargs.get('slug')
+            Exists(tagged)
         )
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
         slug = self.kwargs.get('slug')
-        posts = self.get_queryset()  # Get filtered posts
-
-        if not posts:  # Check if there are any posts
-            raise Http404("Nenhum post encontrado com essa tag")
-
-        # Get the first tag object from the first post's tags
-        tag_object = posts[0].tags.filter(slug=slug).first()
+        tag_name = _cached_lookup(
+            Tag, f'name:{slug}',
+            lambda: Tag.objects.filter(
+                slug=slug
+            ).values_list('name', flat=True).first(),
+        )
 
-        if tag_object:
-            page_title = f'{tag_object.name} - Tag - '
-        else:
+        if tag_name is None:
             raise Http404("Tag não encontrada")
 
+        page_title = f'{tag_name} - Tag - '
         ctx.update({'page_title': page_title, })
         return ctx
 
@@ -223,6 +274,10 @@ class SearchListView(PostListView):
     the page title and provides the search query in the context.
 
     Attributes:
+        search_config: The text search configuration used to rank the
+                       results on PostgreSQL.
+        min_search_length: The minimum length of a query that is searched,
+                           shorter queries list no posts.
         _search_value: Stores the sanitized search query.
 
     Methods:
@@ -231,10 +286,14 @@ class SearchListView(PostListView):
             query from the request.
         get_queryset(self) -> QuerySet[Any]:
             Overrides the parent method to filter the queryset based on
-            the search query.
+            the search query, keeping the posts that contain every word of
+            the query. On PostgreSQL the posts matching the full-text
+            `search_vector` are found too, and the posts are ordered by
+            their full-text rank.
         get_context_data(self, **kwargs: Any) -> dict[str, Any]:
-            Overrides the parent method to add a custom `page_title`
-            and the search query to the context.
+            Overrides the parent method to add a custom `page_title`,
+            the search query and the query string kept by the pagination
+            links to the context.
         get(
             self, request: HttpRequest, *args: Any, **kwargs: Any
             ) -> HttpResponse:
@@ -242,6 +301,9 @@ class SearchListView(PostListView):
             if no search query is provided.
     """
 
+    search_config: str = 'portuguese'
+    min_search_length: int = 2
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
         self._search_value = ''
@@ -254,12 +316,43 @@ class SearchListView(PostListView):
         return super().setup(request, *args, **kwargs)
 
     def get_queryset(self) -> QuerySet[Any]:  # type: ignore
-        search_value = self._search_value
+        if len(self._search_value) < self.min_search_length:
+            # Would match nearly every post.
+            return super().get_queryset().none()  # type: ignore
+
+        words = self._search_value.split()
+        if connection.vendor != 'postgresql':
+            # Without the trigram indexes, one `LIKE` per word on the joined
+            # columns is cheaper than three. The words have no spaces, so
+            # none of them can match across two columns.
+            return super().get_queryset().annotate(  # type: ignore
+                haystack=Concat(
+                    'title', Value(' '), 'excerpt', Value(' '), 'content',
+                    output_field=TextField(),
+                )
+            ).filter(*(Q(haystack__icontains=word) for word in words))
+
+        # Every word must be found, in any of the columns and in any order.
+        # Each column keeps its own condition, which the trigram index of
+        # the column can serve.
+        search_filter = reduce(operator.and_, (
+            Q(title__icontains=word) |
+            Q(excerpt__icontains=word) |
+            Q(content__icontains=word)
+            for word in words
+        ))
+
+        # The GIN indexed `search_vector` also finds the other inflections
+        # of the words, e.g. "gatos" finds a post about a "gato".
+        search_query = SearchQuery(
+            self._search_value, config=self.search_config)
+        # Best full-text matches first, posts only found by `icontains`
+        # have a rank of 0 and are listed last.
         return super().get_queryset().filter(  # type: ignore
-            Q(title__icontains=search_value) |
-            Q(excerpt__icontains=search_value) |
-            Q(content__icontains=search_value)
-        )[0:PER_PAGE]
+            search_filter | Q(search_vector=search_query)
+        ).annotate(
+            rank=SearchRank(F('search_vector'), search_query)
+        ).order_by('-rank', '-pk')
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
@@ -267,6 +360,8 @@ class SearchListView(PostListView):
         ctx.update({
             'page_title': f'{search_value[:30]} - Search - ',
             'search_value': search_value,
+            # Appended to the pagination links to keep the query.
+            'search_url': '&' + urlencode({'q': search_value}),
         })
         return ctx
 
@@ -303,9 +398,9 @@ def sanitize_search_query(query: str) -> str:
     Returns:
         str: The sanitized search query string.
     """
-    query = re.sub(r'[^\w\s]', ' ', query)
-    query = ' '.join(query.lower().split())
-    return query
+    if not query:
+        return ''
+    return ' '.join(_NON_WORD_RE.sub(' ', query).lower().split())
 
 
 class PageDetailView(DetailView):
@@ -331,10 +426,10 @@ class PageDetailView(DetailView):
     Methods:
         get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             This method is called to add context data to the template. It
-            retrieves the default context from the parent class, retrieves the
-            page object using `self.get_object()`, constructs the page title,
-            and updates the context with the `page_title`. Returns the updated
-            context.
+            retrieves the default context from the parent class, reads the
+            page already loaded by `get()` from `self.object`, constructs the
+            page title, and updates the context with the `page_title`. Returns
+            the updated context.
 
         get_queryset(self) -> QuerySet[Any]:
             This method is called to filter the query result set. It retrieves
@@ -349,8 +444,7 @@ class PageDetailView(DetailView):
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
-        page_obj = self.get_object()
-        page_title = f'{page_obj.title} - Página - '
+        page_title = f'{self.object.title} - Página - '
         ctx.update({'page_title': page_title, })
 
         return ctx
@@ -384,14 +478,17 @@ class PostDetailView(DetailView):
         get_context_data(self, **kwargs: Any) -> dict[str, Any]:
             This method is called to add additional data to the context
             dictionary that will be passed to the template. It retrieves the
-            default context from the parent class, retrieves the current post
-            object, constructs the page title, updates the context with the
+            default context from the parent class, reads the current post
+            already loaded by `get()` from `self.object`, constructs the page
+            title, updates the context with the
             `page_title`, and returns the updated context.
 
         get_queryset(self) -> QuerySet[Post]:  # Corrected type annotation
             This method is called to filter the queryset of posts. It retrieves
             the default queryset from the parent class, filters the queryset to
-            include only published posts, and returns the filtered queryset.
+            include only published posts, joins the author and the category
+            and prefetches the tags rendered by the template, and returns the
+            filtered queryset.
             The type annotation is corrected to `QuerySet[Post]` to reflect the
             actual content.
     """
@@ -402,10 +499,11 @@ class PostDetailView(DetailView):
 
     def get_context_data(self, **kwargs: Any) -> dict[str, Any]:
         ctx = super().get_context_data(**kwargs)
-        post_obj = self.get_object()
-        page_title = f'{post_obj.title} - Post - '
+        page_title = f'{self.object.title} - Post - '
         ctx.update({'page_title': page_title, })
         return ctx
 
     def get_queryset(self) -> QuerySet[Any]:  # type: ignore
-        return super().get_queryset().filter(is_published=True)
+        return super().get_queryset().filter(
+            is_published=True
+        ).select_related('created_by', 'category').prefetch_related('tags')
@@ -103,6 +103,24 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # Keep the connection open between requests instead of connecting on
+        # every request, checking it is still usable before reusing it.
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', '60')),
+        'CONN_HEALTH_CHECKS': True,
+    }
+}
+
+# The site setup, the post listings and the admin autocomplete are cached and
+# dropped by signals when they change. The default LocMemCache is per process,
+# so with several workers the others keep their entries until they expire:
+# set a shared backend (e.g. Redis, Memcached or DatabaseCache) in production.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.locmem.LocMemCache',
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
     }
 }
 
@@ -147,6 +165,10 @@ STATIC_ROOT = DATA_DIR / 'static'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = DATA_DIR / 'media'
 
+# Largest upload accepted by `utils.model_validators.validate_file_size`.
+# Django's default handlers stream large uploads to a temporary file.
+FILE_UPLOAD_MAX_SIZE = 30 * 1024 * 1024
+
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
@@ -185,7 +207,7 @@ SUMMERNOTE_CONFIG = {
     'css': (
         '//cdnjs.cloudflare.com/ajax/libs/codemirror/6.65.7/theme/dracula.min.css',  # noqa: E501
     ),
-    'attachment_filesize_limit': 30 * 1024 * 1024,
+    'attachment_filesize_limit': FILE_UPLOAD_MAX_SIZE,
     'attachment_model': 'blog.PostAttachment',
 }
 
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class SiteSetupConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'site_setup'
+
+    def ready(self):
+        # pylint: disable=import-outside-toplevel,unused-import
+        import site_setup.signals  # noqa: F401
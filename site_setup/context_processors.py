@@ -6,5 +6,5 @@ def context_processor_example(request):
 
 
 def site_setup(request):
-    setup = SiteSetup.objects.order_by('-id').first()
+    setup = SiteSetup.get_solo()
     return {'site_setup': setup, }
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.6 on 2026-10-15 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('site_setup', '0006_alter_menulink_site_setup'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='menulink',
+            options={'ordering': ('id',), 'verbose_name': 'Menu Link', 'verbose_name_plural': 'Menu Links'},
+        ),
+        migrations.AddIndex(
+            model_name='menulink',
+            index=models.Index(fields=['site_setup', 'id'], name='site_setup__site_se_7f0f1c_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.0.6 on 2026-10-15 09:12
+
+import utils.model_validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('site_setup', '0007_menulink_ordering_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='sitesetup',
+            name='favicon',
+            field=models.ImageField(blank=True, default='', upload_to='assets/favicon/%Y/%m/', validators=[utils.model_validators.validate_file_size, utils.model_validators.validate_png]),
+        ),
+    ]
@@ -5,9 +5,15 @@ This module contains two models: SiteSetup and MenuLink. The SiteSetup model
 represents the site's setup, and the MenuLink model represents a link in the
 site's menu.
 """
+from django.core.cache import cache
 from django.db import models
-from utils.model_validators import validate_png
-from utils.images import resize_image
+from utils.model_validators import validate_file_size, validate_png
+from utils.images import resize_uploaded_image
+
+SITE_SETUP_CACHE_KEY = 'site_setup'
+# Seconds the site setup is cached. It is also dropped whenever it changes,
+# but only from a shared cache backend, see `CACHES` in the settings.
+SITE_SETUP_CACHE_TIMEOUT = 300
 
 
 class MenuLink(models.Model):
@@ -28,6 +34,11 @@ class MenuLink(models.Model):
         """
         verbose_name = 'Menu Link'
         verbose_name_plural = 'Menu Links'
+        # The links are shown in the order they were added.
+        ordering = ('id',)
+        indexes = [
+            models.Index(fields=['site_setup', 'id']),
+        ]
 
     text: str = models.CharField(max_length=50)  # type: ignore
     url_or_path: str = models.CharField(max_length=2048)  # type: ignore
@@ -41,6 +52,19 @@ class MenuLink(models.Model):
         return str(self.text)
 
 
+class SiteSetupManager(models.Manager):
+    """
+    Custom manager for the SiteSetup model.
+    """
+
+    def with_menu(self):
+        """
+        Returns a queryset of site setups with their menu links prefetched, so
+        iterating `site_setup.menu` in the templates runs no query.
+        """
+        return self.get_queryset().prefetch_related('menu')
+
+
 class SiteSetup(models.Model):
     """
     SiteSetup model represents the site's setup.
@@ -55,6 +79,13 @@ class SiteSetup(models.Model):
         show_pagination (bool): Whether to show the pagination.
         show_footer (bool): Whether to show the footer.
 
+    Methods:
+        get_solo(cls) -> SiteSetup | None:
+            Returns the current site setup with its menu links, read from the
+            cache.
+        clear_cache(cls) -> None:
+            Drops the cached site setup.
+
     Returns:
         str: A string representation of the site setup.
     """
@@ -77,34 +108,56 @@ class SiteSetup(models.Model):
 
     favicon = models.ImageField(
         upload_to='assets/favicon/%Y/%m/',
-        blank=True, default='', validators=[validate_png],
+        blank=True, default='',
+        validators=[validate_file_size, validate_png],
     )
 
     def save(self, *args, **kwargs):
         """
-        Save the object and resize the favicon if it has changed.
+        Save the object, resizing a newly uploaded favicon.
 
-        This method overrides the default `save` method to check if the
-        favicon has changed. If the favicon has changed, it resizes the
-        favicon to a width of 32 pixels.
+        This method overrides the default `save` method to resize the
+        uploaded favicon to a width of 32 pixels in memory before the storage
+        writes it, so the file is written once and the storage is never
+        read back by its path.
 
         Args:
             *args: Positional arguments for the `save` method.
             **kwargs: Keyword arguments for the `save` method.
         """
-        current_favicon_name = str(self.favicon.name)
-        # print('current_favicon_name', current_favicon_name)
+        update_fields = kwargs.get('update_fields')
+        # pylint: disable=protected-access
+        if (self.favicon and not self.favicon._committed
+                and (update_fields is None or 'favicon' in update_fields)):
+            resize_uploaded_image(self.favicon, 32)
+
         super().save(*args, **kwargs)
-        favicon_changed = False
 
-        if self.favicon:
-            favicon_changed = current_favicon_name != self.favicon.name
+    objects = SiteSetupManager()
 
-        # print('favicon_changed', favicon_changed)
-        if favicon_changed:
-            resize_image(self.favicon, 32)
+    @classmethod
+    def get_solo(cls):
+        """
+        Return the latest site setup, with its menu links prefetched, from the
+        cache, so rendering a page does not query it.
 
-    objects = models.Manager()
+        The cached setup is dropped by the signals of `site_setup.signals`
+        whenever a site setup or a menu link is saved or deleted. With the
+        per-process LocMemCache only the worker that saved it drops it, the
+        others keep it for up to `SITE_SETUP_CACHE_TIMEOUT` seconds.
+        """
+        return cache.get_or_set(
+            SITE_SETUP_CACHE_KEY,
+            lambda: cls.objects.with_menu().order_by('-id').first(),
+            SITE_SETUP_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Drop the cached site setup, so the next `get_solo` reads it again.
+        """
+        cache.delete(SITE_SETUP_CACHE_KEY)
 
     def __str__(self) -> str:
         return str(self.title)
@@ -0,0 +1,20 @@
+"""
+Signal receivers of the site_setup application.
+
+Functions:
+    clear_site_setup_cache(sender, **kwargs)
+        Drop the cached site setup when a site setup or one of its menu links
+        is saved or deleted.
+"""
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from site_setup.models import MenuLink, SiteSetup
+
+
+@receiver([post_save, post_delete], sender=MenuLink)
+@receiver([post_save, post_delete], sender=SiteSetup)
+def clear_site_setup_cache(sender, **kwargs):
+    """
+    Drop the cached site setup, which holds the menu links too.
+    """
+    SiteSetup.clear_cache()
@@ -0,0 +1,71 @@
+"""
+Tests the `site_setup` context processor, which adds the cached site setup to
+the context of every page.
+"""
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from site_setup.context_processors import site_setup
+from site_setup.models import MenuLink, SiteSetup
+
+
+class SiteSetupContextProcessorTest(TestCase):
+    """
+    Tests the caching of the site setup read by the context processor.
+    """
+
+    def setUp(self):
+        cache.clear()
+        self.request = RequestFactory().get('/')
+        self.setup = SiteSetup.objects.create(
+            title='Site Title', description='Site description')
+        MenuLink.objects.create(
+            text='Home', url_or_path='/', site_setup=self.setup)
+
+    def test_site_setup_and_menu_are_cached(self):
+        """
+        Tests if the site setup and its menu links are read from the database
+        only once.
+        """
+        site_setup(self.request)
+
+        with self.assertNumQueries(0):
+            setup = site_setup(self.request)['site_setup']
+            menu = [link.text for link in setup.menu.all()]
+
+        self.assertEqual(setup, self.setup)
+        self.assertEqual(menu, ['Home'])
+
+    def test_site_setup_cache_is_cleared_when_the_setup_changes(self):
+        """
+        Tests if the changed site setup is read again after it is saved.
+        """
+        site_setup(self.request)
+
+        self.setup.title = 'New Title'
+        self.setup.save()
+
+        setup = site_setup(self.request)['site_setup']
+        self.assertEqual(setup.title, 'New Title')
+
+    def test_site_setup_cache_is_cleared_when_a_menu_link_changes(self):
+        """
+        Tests if the menu links are read again after one of them is added.
+        """
+        site_setup(self.request)
+
+        MenuLink.objects.create(
+            text='Blog', url_or_path='/blog/', site_setup=self.setup)
+
+        setup = site_setup(self.request)['site_setup']
+        self.assertEqual(
+            [link.text for link in setup.menu.all()], ['Home', 'Blog'])
+
+    def test_site_setup_with_menu_prefetches_the_menu_links(self):
+        """
+        Tests if `with_menu` loads the menu links with one extra query.
+        """
+        with self.assertNumQueries(2):
+            setup = SiteSetup.objects.with_menu().get(pk=self.setup.pk)
+            menu = [link.text for link in setup.menu.all()]
+
+        self.assertEqual(menu, ['Home'])
@@ -0,0 +1,70 @@
+"""
+Tests the validation of the SiteSetup model fields.
+"""
+import tempfile
+from io import BytesIO
+from django.core.exceptions import ValidationError
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from PIL import Image
+from site_setup.models import SiteSetup
+
+
+class SiteSetupFaviconValidationTest(SimpleTestCase):
+    """
+    Tests the PNG validation of the favicon uploads.
+    """
+
+    def uploaded_image(self, name, image_format):
+        buffer = BytesIO()
+        Image.new('RGB', (64, 64), 'blue').save(buffer, format=image_format)
+        return SimpleUploadedFile(name, buffer.getvalue())
+
+    def validate_favicon(self, upload):
+        setup = SiteSetup(title='Site Title', favicon=upload)
+        setup.clean_fields(exclude=['title', 'description'])
+
+    def test_favicon_accepts_a_png_upload(self):
+        """
+        Tests if a PNG upload passes the validation.
+        """
+        self.validate_favicon(self.uploaded_image('favicon.png', 'PNG'))
+
+    def test_favicon_rejects_a_jpeg_renamed_to_png(self):
+        """
+        Tests if a JPEG upload with a `.png` name is rejected by its
+        signature.
+        """
+        with self.assertRaises(ValidationError):
+            self.validate_favicon(self.uploaded_image('favicon.png', 'JPEG'))
+
+    def test_favicon_rejects_a_file_without_png_extension(self):
+        """
+        Tests if an upload without the `.png` extension is rejected.
+        """
+        with self.assertRaises(ValidationError):
+            self.validate_favicon(self.uploaded_image('favicon.jpg', 'PNG'))
+
+
+class SiteSetupFaviconResizeTest(TestCase):
+    """
+    Tests the resizing of the favicon uploads.
+    """
+
+    def test_favicon_is_resized_before_it_is_stored(self):
+        """
+        Tests if an uploaded favicon is stored 32 pixels wide.
+        """
+        buffer = BytesIO()
+        Image.new('RGB', (64, 64), 'blue').save(buffer, format='PNG')
+        favicon = SimpleUploadedFile('favicon.png', buffer.getvalue())
+
+        with tempfile.TemporaryDirectory() as media_root:
+            with override_settings(MEDIA_ROOT=media_root):
+                setup = SiteSetup(title='Site Title', favicon=favicon)
+                setup.save()
+
+                with setup.favicon.open('rb') as stored_favicon:
+                    with Image.open(stored_favicon) as image:
+                        self.assertEqual(image.size, (32, 32))
+                        self.assertEqual(image.format, 'PNG')
@@ -1,17 +1,26 @@
 import time
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
-from utils.browser import make_chrome_browser
+from utils.browser import make_edge_browser
 from blog.tests.test_blog_base import BlogMixin
 
 
 class TestBlogBaseFunctional(StaticLiveServerTestCase, BlogMixin):
+    # One browser is started for all the tests of the class, starting the
+    # driver takes longer than most of the tests.
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.browser = make_edge_browser(headless=False)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.browser.quit()
+        super().tearDownClass()
+
     def setUp(self) -> None:
-        self.browser = make_chrome_browser(headless=False)
+        self.browser.delete_all_cookies()
+        self.browser.get('about:blank')
         return super().setUp()
 
-    def tearDown(self) -> None:
-        self.browser.quit()
-        return super().tearDown()
-
     def sleep(self, seconds=5):
         time.sleep(seconds)
@@ -1,20 +1,31 @@
 import pytest
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 import time
 from django.contrib.staticfiles.testing import StaticLiveServerTestCase
-from utils.browser import make_chrome_browser
+from utils.browser import make_edge_browser
 from blog.tests.test_blog_base import BlogMixin
 
 
 class TestBlogBaseFunctional(StaticLiveServerTestCase, BlogMixin):
+    # One browser is started for all the tests of the class, starting the
+    # driver takes longer than most of the tests.
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.browser = make_edge_browser(headless=False)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.browser.quit()
+        super().tearDownClass()
+
     def setUp(self) -> None:
-        self.browser = make_chrome_browser(headless=False)
+        self.browser.delete_all_cookies()
+        self.browser.get('about:blank')
         return super().setUp()
 
-    def tearDown(self) -> None:
-        self.browser.quit()
-        return super().tearDown()
-
     def sleep(self, seconds=5):
         time.sleep(seconds)
 
@@ -24,6 +35,9 @@ class TestBlogHomePageFunctional(TestBlogBaseFunctional):
 
     def test_blog_home_no_post_error_message_no_post(self):
         self.browser.get(self.live_server_url)
-        body = self.browser.find_element(By.TAG_NAME, 'body')
-        self.sleep(15)
-        self.assertIn('Nenhum post encontrado aqui 🥲', body.text)
+        # Waits only until the message is rendered, up to 15 seconds.
+        found = WebDriverWait(self.browser, 15).until(
+            EC.text_to_be_present_in_element(
+                (By.TAG_NAME, 'body'), 'Nenhum post encontrado aqui 🥲')
+        )
+        self.assertTrue(found)
@@ -1,29 +1,52 @@
+from functools import lru_cache
+from shutil import which
 from time import sleep
 from selenium import webdriver
+from selenium.webdriver.common.driver_finder import DriverFinder
 
 
-def make_chrome_browser(headless=False):
-    """Creates a new Chrome browser instance, optionally in headless mode.
+@lru_cache(maxsize=1)
+def edgedriver_path():
+    """Finds the msedgedriver executable once per process.
+
+    The `msedgedriver` of the PATH is used when there is one, otherwise
+    Selenium Manager looks it up (and downloads it if needed), which is too
+    slow to run for every browser.
+
+    Returns:
+        str: The path of the msedgedriver executable.
+    """
+    path = which('msedgedriver')
+    if path:
+        return path
+    return DriverFinder(
+        webdriver.EdgeService(), webdriver.EdgeOptions()
+    ).get_driver_path()
+
+
+def make_edge_browser(headless=False):
+    """Creates a new Edge browser instance, optionally in headless mode.
 
     Args:
         headless (bool, optional): Whether to run the browser in headless mode.
         Defaults to False.
 
     Returns:
-        webdriver.Chrome: The newly created Chrome browser instance.
+        webdriver.Edge: The newly created Edge browser instance.
     """
     options = webdriver.EdgeOptions()
     if headless:
         # Use --headless=new for latest versions
         options.add_argument("--headless=new")
 
-    driver = webdriver.Edge(options=options)
+    service = webdriver.EdgeService(executable_path=edgedriver_path())
+    driver = webdriver.Edge(service=service, options=options)
     return driver
 
 
 if __name__ == "__main__":
     # Set headless to True for headless mode
-    browser = make_chrome_browser(headless=False)
+    browser = make_edge_browser(headless=False)
     browser.get("http://www.udemy.com/")
     # Add your browser interactions here (e.g., find elements, interact with
     # the page)
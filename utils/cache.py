@@ -0,0 +1,46 @@
+"""
+Module for cache helper functions.
+
+This module contains functions that version the cache entries of a model, so
+all of them can be invalidated at once without deleting keys by pattern.
+
+The version is stored in the cache itself, so a new version is seen by every
+worker only with a shared cache backend. With the per-process LocMemCache the
+other workers keep their entries until they expire.
+
+Functions:
+    model_cache_version(model)
+        Return the current cache version of the model.
+    invalidate_model_cache(model)
+        Start a new cache version for the model.
+"""
+import time
+
+from django.core.cache import cache
+
+
+def _version_key(model):
+    return f'{model._meta.label_lower}:cache-version'
+
+
+def model_cache_version(model):
+    """
+    Return the current cache version of the model.
+
+    The version is part of the keys cached for the model, so the entries of
+    an older version are never read again and simply expire.
+
+    :param model: The model class.
+    :return: int. The current cache version of the model.
+    """
+    return cache.get_or_set(_version_key(model), time.time_ns, None)
+
+
+def invalidate_model_cache(model):
+    """
+    Start a new cache version for the model, invalidating all the entries
+    cached with the previous version.
+
+    :param model: The model class.
+    """
+    cache.set(_version_key(model), time.time_ns(), None)
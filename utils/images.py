@@ -3,46 +3,54 @@ Module for image processing functions.
 
 This module contains functions for processing and manipulating images.
 """
-from pathlib import Path
+from io import BytesIO
 
-from django.conf import settings
+from django.core.files.base import ContentFile
 from PIL import Image
 
 
-def resize_image(image_django, new_width=800, optimize=True, quality=60):
+def resize_uploaded_image(
+        image_django, new_width=800, optimize=True, quality=60):
     """
-    Resize an image to a specified width.
+    Resize an uploaded image before it is written to the storage.
 
-    This function resizes an image to a specified width using the Pillow
-    library. It also optimizes the image for web use and reduces its quality
-    to save space.
+    The image is resized in memory and the pending upload of the field file
+    is replaced by the resized content, so the storage writes the file only
+    once instead of writing the upload and then rewriting it resized.
 
     Args:
-        image_django (File): The Django file object to resize.
+        image_django (FieldFile): The field file holding the uncommitted
+        upload.
         new_width (int): The new width of the image. Default is 800.
         optimize (bool): Whether to optimize the image for web use. Default
         is True.
         quality (int): The quality of the image. Default is 60.
-
-    Returns:
-        Image: The resized image.
     """
-    image_path = Path(settings.MEDIA_ROOT / image_django.name).resolve()
-    image_pillow = Image.open(image_path)
-    original_width, original_height = image_pillow.size
-
-    if original_width <= new_width:
-        image_pillow.close()
-        return image_pillow
-
-    new_height = round(new_width * original_height / original_width)
-
-    new_image = image_pillow.resize((new_width, new_height), Image.LANCZOS)
-
-    new_image.save(
-        image_path,
-        optimize=optimize,
-        quality=quality,
-    )
-
-    return new_image
+    upload = image_django.file
+    upload.seek(0)
+    # Closing the image doesn't close `upload`, which Pillow didn't open.
+    with Image.open(upload) as image_pillow:
+        image_format = image_pillow.format
+        original_width, original_height = image_pillow.size
+
+        if original_width <= new_width:
+            upload.seek(0)
+            return
+
+        new_height = round(new_width * original_height / original_width)
+
+        # `thumbnail` lets JPEG decoders scale down by 1/2, 1/4 or 1/8 while
+        # decoding (`draft`) and reduces the rest with a fast box filter
+        # before the final LANCZOS pass.
+        image_pillow.thumbnail(
+            (new_width, new_height), Image.LANCZOS, reducing_gap=2.0)
+
+        buffer = BytesIO()
+        image_pillow.save(
+            buffer,
+            format=image_format,
+            optimize=optimize,
+            quality=quality,
+        )
+
+    image_django.file = ContentFile(buffer.getvalue(), name=upload.name)
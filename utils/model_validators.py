@@ -3,16 +3,58 @@ This module contains custom validators for Django models.
 
 Validators:
     validate_png: Validates that an image is a PNG file.
+    validate_file_size: Validates that an upload is not larger than
+    `FILE_UPLOAD_MAX_SIZE`.
 """
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.template.defaultfilters import filesizeformat
+
+# The first 8 bytes of every PNG file.
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
 
 
 def validate_png(image):
     """
     Validate that the image is a PNG file.
 
-    This function checks if the image is a PNG file by checking its file
-    extension. If the image is not a PNG file, it raises a ValidationError.
+    This function checks the file extension of the image and, for new
+    uploads, the PNG signature of its first 8 bytes, so a file renamed to
+    `.png` is rejected without decoding it. Files already in the storage were
+    checked when uploaded and are not read again. If the image is not a PNG
+    file, it raises a ValidationError.
     """
     if not image.name.lower().endswith('.png'):
         raise ValidationError("Image must be a PNG file")
+
+    if getattr(image, '_committed', False):
+        return
+
+    upload = image.file
+    position = upload.tell()
+    upload.seek(0)
+    signature = upload.read(len(PNG_SIGNATURE))
+    upload.seek(position)
+
+    if signature != PNG_SIGNATURE:
+        raise ValidationError("Image must be a PNG file")
+
+
+def validate_file_size(file):
+    """
+    Validate that the file is not larger than `settings.FILE_UPLOAD_MAX_SIZE`.
+
+    Only new uploads are checked, files already in the storage were checked
+    when uploaded and are not read again. If the file is too large, it raises
+    a ValidationError.
+    """
+    if getattr(file, '_committed', False):
+        return
+
+    if file.size > settings.FILE_UPLOAD_MAX_SIZE:
+        raise ValidationError(
+            "File must be at most %(max_size)s",
+            params={
+                'max_size': filesizeformat(settings.FILE_UPLOAD_MAX_SIZE),
+            },
+        )
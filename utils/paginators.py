@@ -0,0 +1,95 @@
+"""
+Module for custom paginators.
+
+This module contains paginators that avoid expensive `COUNT(*)` queries on
+large tables.
+
+Classes:
+    EstimatedCountPaginator
+        A paginator that uses the PostgreSQL planner statistics as the count
+        of unfiltered querysets.
+    CachedCountPaginator
+        A paginator that caches the count of each queryset until its model
+        changes.
+"""
+from hashlib import md5
+
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+from utils.cache import model_cache_version
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    A paginator that reads the number of rows of an unfiltered queryset from
+    `pg_class.reltuples` instead of running `SELECT COUNT(*)`, which scans
+    the whole table on PostgreSQL.
+
+    The exact count is still used when the queryset is filtered (list
+    filters or search), when the database is not PostgreSQL, or when the
+    estimate is below `estimate_threshold`, where counting is cheap and the
+    statistics may be stale or missing.
+
+    Attributes:
+        estimate_threshold (int): The minimum estimated number of rows for
+        the estimate to be used.
+    """
+    estimate_threshold: int = 10_000
+
+    @cached_property
+    def count(self) -> int:
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+
+        connection = connections[self.object_list.db]  # type: ignore
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                [self.object_list.model._meta.db_table],  # type: ignore
+            )
+            row = cursor.fetchone()
+
+        if row is None or row[0] < self.estimate_threshold:
+            return super().count
+        return row[0]
+
+
+class CachedCountPaginator(Paginator):
+    """
+    A paginator that caches the `SELECT COUNT(*)` of a queryset, keyed by its
+    SQL and the cache version of its model, so the count is run again only
+    after the model's cache is invalidated or `count_cache_timeout` expires.
+
+    Attributes:
+        count_cache_timeout (int): The number of seconds a count is cached.
+    """
+    count_cache_timeout: int = 300
+
+    @cached_property
+    def count(self) -> int:
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.is_empty():
+            return super().count
+
+        try:
+            sql, params = query.sql_with_params()
+        except EmptyResultSet:
+            return super().count
+
+        model = self.object_list.model  # type: ignore
+        digest = md5(
+            f'{sql}{params}'.encode(), usedforsecurity=False).hexdigest()
+        key = (f'{model._meta.label_lower}:count:'
+               f'{model_cache_version(model)}:{digest}')
+        return cache.get_or_set(
+            key, lambda: super(CachedCountPaginator, self).count,
+            self.count_cache_timeout,
+        )
@@ -7,27 +7,64 @@ Functions:
         Generate a random string of alphanumeric characters with the specified
         length `k`.
 
+    slugify_base(text)
+        Slugify `text`, caching the result for short strings.
+
     slugify_new(text)
         Generate a slugified string with a random string of 4 alphanumeric
         characters appended to it.
 
+    bulk_unique_slugs(model, texts, k=4, reserved=())
+        Generate with `slugify_new` a slug for each text that is not used in
+        the model's table, checking all of them with a single query.
+
 """
 import string
+from functools import lru_cache
 from random import SystemRandom
 from django.utils.text import slugify
 
+SYSTEM_RANDOM = SystemRandom()
+RANDOM_CHARS = string.ascii_lowercase + string.digits
+SLUG_CACHE_MAX_LENGTH = 255
+
 
 def random_letters(k=5):
     """
     Generate a random string of alphanumeric characters with the specified
     length `k`.
 
+    The characters are the base-36 digits of a single random number, so the
+    system random source is read once instead of once per character.
+
     :param k: int, optional, default=5. The length of the random string.
     :return: str. A random string of alphanumeric characters with length `k`.
     """
-    return ''.join(SystemRandom().choices(
-        string.ascii_lowercase + string.digits, k=k
-    ))
+    number = SYSTEM_RANDOM.randrange(len(RANDOM_CHARS) ** k)
+    chars = []
+    for _ in range(k):
+        number, index = divmod(number, len(RANDOM_CHARS))
+        chars.append(RANDOM_CHARS[index])
+    return ''.join(chars)
+
+
+@lru_cache(maxsize=4096)
+def _cached_slugify(text):
+    return slugify(text)
+
+
+def slugify_base(text):
+    """
+    Slugify `text`, caching the result for strings of up to
+    `SLUG_CACHE_MAX_LENGTH` characters, so saving objects with the same name
+    or title does not run the slugify regexes again.
+
+    :param text: str. The text to be slugified.
+    :return: str. The slugified text.
+    """
+    if isinstance(text, str) and len(text) <= SLUG_CACHE_MAX_LENGTH:
+        return _cached_slugify(text)
+    return slugify(text)
 
 
 def slugify_new(text, k=5):
@@ -39,4 +76,44 @@ def slugify_new(text, k=5):
     :return: str. A slugified string with a random string of 4 alphanumeric
     characters appended to it.
     """
-    return slugify(text) + '-' + random_letters(k)
+    return slugify_base(text) + '-' + random_letters(k)
+
+
+def bulk_unique_slugs(model, texts, k=4, reserved=()):
+    """
+    Generate with `slugify_new` a slug for each text of `texts` that is not
+    used by any row of `model` nor by another text.
+
+    All the candidates are checked with a single `slug__in` query, only the
+    rare colliding ones are generated again and checked in another round.
+
+    :param model: The model class whose `slug` column must be unique.
+    :param texts: iterable of str. The texts to be slugified.
+    :param k: int, optional, default=4. The length of the random suffix.
+    :param reserved: iterable of str, optional. Slugs that are not stored yet
+    but can't be used either.
+    :return: list of str. The slugs, in the order of `texts`.
+    """
+    texts = list(texts)
+    slugs = [''] * len(texts)
+    used_slugs = set(reserved)
+    pending = list(range(len(texts)))
+
+    while pending:
+        for i in pending:
+            slugs[i] = slugify_new(texts[i], k)
+
+        # pylint: disable=protected-access
+        taken = set(model._default_manager.filter(
+            slug__in=[slugs[i] for i in pending]
+        ).values_list('slug', flat=True))
+
+        colliding = []
+        for i in pending:
+            if slugs[i] in taken or slugs[i] in used_slugs:
+                colliding.append(i)
+            else:
+                used_slugs.add(slugs[i])
+        pending = colliding
+
+    return slugs